@@ -6,18 +6,52 @@ from django.utils.safestring import mark_safe
 from django.utils import timezone
 from django.http import HttpRequest
 from django.db.models.query import QuerySet
+from django.db import transaction
 from typing import Optional, Dict, Any, List, Tuple
-from django.db.models import F
+from django.db.models import F, Exists, OuterRef, Case, When, Value, ExpressionWrapper, FloatField
+from functools import lru_cache
 
 
 from .models import (
     Brand,
     Campaign,
+    CampaignStatus,
     SpendRecord,
     DaypartingSchedule,
 )
 
 
+@lru_cache(maxsize=None)
+def _change_url_template(model_name: str) -> str:
+    """Resolve a model's admin change URL once, with a ``{}`` placeholder for the pk."""
+    url = reverse(f'admin:budget_{model_name}_change', args=[0])
+    return url.replace('/0/', '/{}/')
+
+
+def _change_url(model_name: str, pk: int) -> str:
+    """Build the admin change URL for an object without going through the resolver."""
+    return _change_url_template(model_name).format(pk)
+
+
+def _budget_used_pct(spend_field: str, budget_field: str) -> Case:
+    """SQL expression for the percentage of a budget used, NULL when the budget is zero."""
+    return Case(
+        When(**{budget_field: 0}, then=Value(None)),
+        default=ExpressionWrapper(
+            F(spend_field) * 100.0 / F(budget_field),
+            output_field=FloatField(),
+        ),
+        output_field=FloatField(),
+    )
+
+
+def _format_pct(percentage: Optional[float]) -> str:
+    """Format an annotated budget percentage for display."""
+    if percentage is None:
+        return "N/A"
+    return f"{percentage:.1f}%"
+
+
 class BrandAdmin(admin.ModelAdmin):
     """Admin configuration for the Brand model."""
     list_display = (
@@ -68,29 +102,35 @@ class BrandAdmin(admin.ModelAdmin):
         }),
     )
     
+    def get_queryset(self, request: HttpRequest) -> QuerySet[Brand]:
+        """Annotate budget usage percentages so they are computed by the database."""
+        queryset = super().get_queryset(request)
+        return queryset.annotate(
+            _daily_pct=_budget_used_pct('current_daily_spend', 'daily_budget'),
+            _monthly_pct=_budget_used_pct('current_monthly_spend', 'monthly_budget'),
+        )
+    
     def daily_budget_used(self, obj: Brand) -> str:
         """Display the percentage of daily budget used."""
-        if obj.daily_budget == 0:
-            return "N/A"
-        percentage = (obj.current_daily_spend / obj.daily_budget) * 100
-        return f"{percentage:.1f}%"
+        return _format_pct(obj._daily_pct)  # type: ignore[attr-defined]
     daily_budget_used.short_description = 'Daily Budget Used'  # type: ignore[attr-defined]
+    daily_budget_used.admin_order_field = '_daily_pct'  # type: ignore[attr-defined]
     
     def monthly_budget_used(self, obj: Brand) -> str:
         """Display the percentage of monthly budget used."""
-        if obj.monthly_budget == 0:
-            return "N/A"
-        percentage = (obj.current_monthly_spend / obj.monthly_budget) * 100
-        return f"{percentage:.1f}%"
+        return _format_pct(obj._monthly_pct)  # type: ignore[attr-defined]
     monthly_budget_used.short_description = 'Monthly Budget Used'  # type: ignore[attr-defined]
+    monthly_budget_used.admin_order_field = '_monthly_pct'  # type: ignore[attr-defined]
     
     actions = ['reset_daily_spend', 'reset_monthly_spend']
     
     def reset_daily_spend(self, request: HttpRequest, queryset: QuerySet[Brand]) -> None:
         """Custom action to reset daily spend for selected brands."""
-        updated = queryset.update(
+        today = timezone.now().date()
+        # Skip rows that are already reset today; writing them again is a no-op
+        updated = queryset.exclude(current_daily_spend=0, last_daily_reset=today).update(
             current_daily_spend=0,
-            last_daily_reset=timezone.now().date()
+            last_daily_reset=today
         )
         self.message_user(
             request, 
@@ -100,9 +140,11 @@ class BrandAdmin(admin.ModelAdmin):
     
     def reset_monthly_spend(self, request: HttpRequest, queryset: QuerySet[Brand]) -> None:
         """Custom action to reset monthly spend for selected brands."""
-        updated = queryset.update(
+        today = timezone.now().date()
+        # Skip rows that are already reset today; writing them again is a no-op
+        updated = queryset.exclude(current_monthly_spend=0, last_monthly_reset=today).update(
             current_monthly_spend=0,
-            last_monthly_reset=timezone.now().date()
+            last_monthly_reset=today
         )
         self.message_user(
             request, 
@@ -164,6 +206,8 @@ class CampaignAdmin(admin.ModelAdmin):
     
     search_fields = ('name', 'brand__name')
     list_select_related = ('brand',)
+    show_full_result_count = False
+    ordering = ('brand__name', 'name')
     readonly_fields = (
         'current_daily_spend',
         'last_daily_reset',
@@ -190,32 +234,44 @@ class CampaignAdmin(admin.ModelAdmin):
     
     def brand_link(self, obj: Campaign) -> str:
         """Create a link to the brand's admin page."""
-        url = reverse('admin:budget_brand_change', args=[obj.brand.id])
+        url = _change_url('brand', obj.brand_id)
         return format_html('<a href="{}">{}</a>', url, obj.brand.name)
     brand_link.short_description = 'Brand'  # type: ignore[attr-defined]
     brand_link.admin_order_field = 'brand__name'  # type: ignore[attr-defined]
     
     def daily_budget_used(self, obj: Campaign) -> str:
         """Display the percentage of daily budget used."""
-        if obj.daily_budget == 0:
-            return "N/A"
-        percentage = (obj.current_daily_spend / obj.daily_budget) * 100
-        return f"{percentage:.1f}%"
+        return _format_pct(obj._daily_pct)  # type: ignore[attr-defined]
     daily_budget_used.short_description = 'Budget Used'  # type: ignore[attr-defined]
+    daily_budget_used.admin_order_field = '_daily_pct'  # type: ignore[attr-defined]
+    
+    def get_queryset(self, request: HttpRequest) -> QuerySet[Campaign]:
+        """Annotate dayparting presence and budget usage in a single query."""
+        queryset = super().get_queryset(request)
+        return queryset.annotate(
+            _has_dayparting=Exists(
+                DaypartingSchedule.objects.filter(campaign=OuterRef('pk'))
+            ),
+            _daily_pct=_budget_used_pct('current_daily_spend', 'daily_budget'),
+        )
     
     def has_dayparting(self, obj: Campaign) -> bool:
         """Check if the campaign has any dayparting schedules."""
-        return obj.dayparting_schedules.exists()
+        has_dayparting: bool = obj._has_dayparting  # type: ignore[attr-defined]
+        return has_dayparting
     has_dayparting.boolean = True  # type: ignore[attr-defined]
     has_dayparting.short_description = 'Has Dayparting'  # type: ignore[attr-defined]
+    has_dayparting.admin_order_field = '_has_dayparting'  # type: ignore[attr-defined]
     
     actions = ['reset_daily_spend', 'activate_campaigns', 'pause_campaigns']
     
     def reset_daily_spend(self, request: HttpRequest, queryset: QuerySet[Campaign]) -> None:
         """Custom action to reset daily spend for selected campaigns."""
-        updated = queryset.update(
+        today = timezone.now().date()
+        # Skip rows that are already reset today; writing them again is a no-op
+        updated = queryset.exclude(current_daily_spend=0, last_daily_reset=today).update(
             current_daily_spend=0,
-            last_daily_reset=timezone.now().date()
+            last_daily_reset=today
         )
         self.message_user(
             request, 
@@ -225,13 +281,30 @@ class CampaignAdmin(admin.ModelAdmin):
     
     def activate_campaigns(self, request: HttpRequest, queryset: QuerySet[Campaign]) -> None:
         """Custom action to activate selected campaigns."""
-        updated = queryset.update(is_active=True)
+        # Only paused campaigns are resumed; completed and archived ones stay as they are
+        now = timezone.now()
+        with transaction.atomic():
+            ids = list(queryset.filter(status=CampaignStatus.PAUSED).values_list('pk', flat=True))
+            updated = Campaign.objects.filter(pk__in=ids).update(
+                status=CampaignStatus.ACTIVE,
+                updated_at=now
+            )
+            # Let the budget and dayparting rules decide whether they can run right away
+            Campaign.objects.filter(pk__in=ids, is_active=False).exclude(
+                Campaign.blocked_q(now)
+            ).update(is_active=True, updated_at=now)
         self.message_user(request, f"Successfully activated {updated} campaigns.")
     activate_campaigns.short_description = "Activate selected campaigns"  # type: ignore[attr-defined]
     
     def pause_campaigns(self, request: HttpRequest, queryset: QuerySet[Campaign]) -> None:
         """Custom action to pause selected campaigns."""
-        updated = queryset.update(is_active=False)
+        # Set the status too; is_active alone would be restored by the next
+        # budget reset, which reactivates every campaign with an active status
+        updated = queryset.filter(status=CampaignStatus.ACTIVE).update(
+            status=CampaignStatus.PAUSED,
+            is_active=False,
+            updated_at=timezone.now()
+        )
         self.message_user(request, f"Successfully paused {updated} campaigns.")
     pause_campaigns.short_description = "Pause selected campaigns"  # type: ignore[attr-defined]
 
@@ -247,10 +320,11 @@ class SpendRecordAdmin(admin.ModelAdmin):
         'created_at',
     )
     
+    # Timestamp drill-down is covered by date_hierarchy; only offer related
+    # objects that actually have spend records.
     list_filter = (
-        'timestamp',
-        'brand',
-        'campaign',
+        ('brand', admin.RelatedOnlyFieldListFilter),
+        ('campaign', admin.RelatedOnlyFieldListFilter),
     )
     
     search_fields = (
@@ -259,6 +333,11 @@ class SpendRecordAdmin(admin.ModelAdmin):
         'reference_id',
     )
     
+    list_select_related = ('brand', 'campaign')
+    show_full_result_count = False
+    ordering = ('-timestamp',)
+    list_per_page = 25
+    
     readonly_fields = (
         'created_at',
     )
@@ -267,16 +346,16 @@ class SpendRecordAdmin(admin.ModelAdmin):
     
     def brand_link(self, obj: SpendRecord) -> str:
         """Create a link to the brand's admin page."""
-        url = reverse('admin:budget_brand_change', args=[obj.brand.id])
+        url = _change_url('brand', obj.brand_id)
         return format_html('<a href="{}">{}</a>', url, obj.brand.name)
     brand_link.short_description = 'Brand'  # type: ignore[attr-defined]
     brand_link.admin_order_field = 'brand__name'  # type: ignore[attr-defined]
     
     def campaign_link(self, obj: SpendRecord) -> str:
         """Create a link to the campaign's admin page if it exists."""
-        if not obj.campaign:
+        if obj.campaign_id is None:
             return "-"
-        url = reverse('admin:budget_campaign_change', args=[obj.campaign.id])
+        url = _change_url('campaign', obj.campaign_id)
         return format_html('<a href="{}">{}</a>', url, obj.campaign.name)
     campaign_link.short_description = 'Campaign'  # type: ignore[attr-defined]
     campaign_link.admin_order_field = 'campaign__name'  # type: ignore[attr-defined]
@@ -309,7 +388,7 @@ class DaypartingScheduleAdmin(admin.ModelAdmin):
     
     def campaign_link(self, obj: DaypartingSchedule) -> str:
         """Create a link to the campaign's admin page."""
-        url = reverse('admin:budget_campaign_change', args=[obj.campaign.id])
+        url = _change_url('campaign', obj.campaign_id)
         return format_html(
             '{} - <a href="{}">{}</a>', 
             obj.campaign.brand.name,
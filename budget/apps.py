@@ -7,12 +7,18 @@ class BudgetConfig(AppConfig):
     """Budget app configuration."""
     default_auto_field: str = 'django.db.models.BigAutoField'
     name: str = 'budget'
+    _ready_called: bool = False
 
     def ready(self) -> None:
         """
         Import signals and tasks when the app is ready.
         This ensures that the signal handlers are registered.
+        Subsequent calls are no-ops so receivers are only wired once.
         """
+        if BudgetConfig._ready_called:
+            return
+        BudgetConfig._ready_called = True
+        
         # Import signals to register them
         import budget.signals  # noqa: F401
         
@@ -2,12 +2,17 @@
 Management command to check and log the current status of campaigns.
 """
 from typing import Any, Dict, List, Optional
+from decimal import Decimal
 from argparse import ArgumentParser
 from django.core.management.base import BaseCommand
 from django.utils import timezone
-from django.db.models import Q, F
+from django.db.models import Q, F, Count, Value, DecimalField, Prefetch
+from django.db.models.functions import Greatest
 
-from budget.models import Campaign, Brand
+from budget.models import Campaign, Brand, CampaignStatus, DaypartingSchedule
+
+# Display names indexed by DaypartingSchedule.day_of_week (0=Monday)
+_DAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
 
 
 class Command(BaseCommand):
@@ -32,7 +37,7 @@ class Command(BaseCommand):
             '--limit',
             type=int,
             default=50,
-            help='Maximum number of campaigns to display (default: 50)'
+            help='Maximum number of campaigns to display, 0 for no limit (default: 50)'
         )
     
     def handle(self, *args: Any, **options: Any) -> None:
@@ -45,7 +50,24 @@ class Command(BaseCommand):
         
         try:
             # Build the base queryset
-            queryset = Campaign.objects.select_related('brand').order_by('brand__name', 'name')
+            queryset = Campaign.objects.select_related('brand').prefetch_related(
+                Prefetch(
+                    'dayparting_schedules',
+                    queryset=DaypartingSchedule.objects.filter(is_active=True).only(
+                        'campaign', 'day_of_week', 'start_time', 'end_time', 'timezone'
+                    ),
+                    to_attr='active_schedules',
+                )
+            ).annotate(
+                remaining=Greatest(
+                    F('daily_budget') - F('current_daily_spend'),
+                    Value(Decimal('0.00')),
+                    output_field=DecimalField(max_digits=12, decimal_places=2),
+                )
+            ).only(
+                'id', 'name', 'status', 'daily_budget', 'current_daily_spend',
+                'is_active', 'brand__id', 'brand__name',
+            ).order_by('brand__name', 'name')
             
             # Apply filters
             if brand_filter:
@@ -61,38 +83,41 @@ class Command(BaseCommand):
                 # This is a simplified check - in a real implementation, you'd check dayparting schedules
                 queryset = queryset.filter(is_active=False)
             
-            # Get the campaigns
-            campaigns = list(queryset[:limit])
+            # Calculate summary statistics over all matching campaigns in one query
+            summary = queryset.aggregate(
+                total=Count('id'),
+                active=Count('id', filter=Q(status=CampaignStatus.ACTIVE)),
+                paused=Count('id', filter=Q(status=CampaignStatus.PAUSED)),
+                completed=Count('id', filter=Q(status=CampaignStatus.COMPLETED)),
+                over_budget=Count('id', filter=Q(current_daily_spend__gte=F('daily_budget'))),
+            )
             
-            if not campaigns:
+            if not summary['total']:
                 self.stdout.write(self.style.WARNING('No campaigns found matching the criteria.'))
                 return
             
-            # Calculate summary statistics
-            total_campaigns = len(campaigns)
-            active_campaigns = sum(1 for c in campaigns if c.status == 'active')
-            paused_campaigns = sum(1 for c in campaigns if c.status == 'paused')
-            completed_campaigns = sum(1 for c in campaigns if c.status == 'completed')
-            
-            over_budget = sum(1 for c in campaigns if c.current_daily_spend >= c.daily_budget)
-            
             # Display summary
             self.stdout.write(self.style.SUCCESS('=== Campaign Status Summary ==='))
-            self.stdout.write(f'Total campaigns: {total_campaigns}')
-            self.stdout.write(f'Active: {active_campaigns}')
-            self.stdout.write(f'Paused: {paused_campaigns}')
-            self.stdout.write(f'Completed: {completed_campaigns}')
-            self.stdout.write(f'Over daily budget: {over_budget}')
+            self.stdout.write(f"Total campaigns: {summary['total']}")
+            self.stdout.write(f"Active: {summary['active']}")
+            self.stdout.write(f"Paused: {summary['paused']}")
+            self.stdout.write(f"Completed: {summary['completed']}")
+            self.stdout.write(f"Over daily budget: {summary['over_budget']}")
             self.stdout.write('\n=== Campaign Details ===\n')
             
-            # Display details for each campaign
-            for campaign in campaigns:
+            # Display details for each campaign, streamed in chunks so memory stays
+            # flat when no limit is given, with one buffered write per campaign
+            campaigns = queryset[:limit] if limit else queryset
+            shown = 0
+            for campaign in campaigns.iterator(chunk_size=500):
+                lines: List[str] = []
                 if campaign.status == 'active':
                     status = self.style.SUCCESS('ACTIVE')
                 elif campaign.status == 'completed':
                     status = self.style.NOTICE('COMPLETED')
                 else:  # paused or any other status
                     status = self.style.ERROR('PAUSED')
+                remaining: Decimal = campaign.remaining  # type: ignore[attr-defined]
                 budget_used = (campaign.current_daily_spend / campaign.daily_budget * 100) if campaign.daily_budget > 0 else 0
                 
                 # Color code the budget usage
@@ -103,41 +128,37 @@ class Command(BaseCommand):
                 else:
                     budget_str = self.style.SUCCESS(f'{budget_used:.1f}%')
                 
-                self.stdout.write(
+                lines.append(
                     f"{status} | {campaign.brand.name} - {campaign.name}"
                 )
-                self.stdout.write(
+                lines.append(
                     f"  Budget: ${campaign.daily_budget:.2f} | "
                     f"Spent: ${campaign.current_daily_spend:.2f} | "
-                    f"Remaining: ${campaign.get_remaining_daily_budget():.2f} ({budget_str})"
+                    f"Remaining: ${remaining:.2f} ({budget_str})"
                 )
                 
                 # Check dayparting status if applicable
-                if hasattr(campaign, 'dayparting_schedules'):
-                    schedules = campaign.dayparting_schedules.filter(is_active=True)
-                    if schedules.exists():
-                        day_of_week_display = {
-                            0: "Monday",
-                            1: "Tuesday",
-                            2: "Wednesday",
-                            3: "Thursday",
-                            4: "Friday",
-                            5: "Saturday",
-                            6: "Sunday"
-                        }
-                        schedule_days = [day_of_week_display.get(s.day_of_week, str(s.day_of_week)) for s in schedules]
-                        self.stdout.write(
-                            f"  Scheduled: {', '.join(schedule_days)} | "
-                            f"{schedules[0].start_time} - {schedules[0].end_time} {schedules[0].timezone}"
-                        )
+                schedules: List[DaypartingSchedule] = campaign.active_schedules  # type: ignore[attr-defined]
+                if schedules:
+                    schedule_days = [
+                        _DAY_NAMES[s.day_of_week] if 0 <= s.day_of_week < 7 else str(s.day_of_week)
+                        for s in schedules
+                    ]
+                    lines.append(
+                        f"  Scheduled: {', '.join(schedule_days)} | "
+                        f"{schedules[0].start_time} - {schedules[0].end_time} {schedules[0].timezone}"
+                    )
+                
+                lines.append('')
                 
-                self.stdout.write('')
+                self.stdout.write('\n'.join(lines) + '\n')
+                shown += 1
             
             # If we limited the results, show a note
-            if len(campaigns) < queryset.count():
+            if shown < summary['total']:
                 self.stdout.write(
                     self.style.WARNING(
-                        f'\nShowing {len(campaigns)} of {queryset.count()} campaigns. '
+                        f"\nShowing {shown} of {summary['total']} campaigns. "
                         'Use --limit to show more.'
                     )
                 )
@@ -1,8 +1,12 @@
 """
 Management command to generate budget performance reports.
 """
+import heapq
+from collections import defaultdict
 from datetime import datetime, timedelta, time, date
-from typing import Any, Dict, List, Tuple
+from decimal import Decimal
+from operator import itemgetter
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
 from argparse import ArgumentParser
 
 from django.core.management.base import BaseCommand
@@ -82,11 +86,20 @@ class Command(BaseCommand):
         start_datetime = timezone.make_aware(datetime.combine(start_date, time.min))
         end_datetime = timezone.make_aware(datetime.combine(end_date, time.max))
         
+        # Stream the per-(brand, campaign) aggregate once, keeping only the
+        # per-brand totals and the running top campaigns in memory
+        brand_totals, campaign_counts, top_rows = self._summarize_spend(
+            self._get_spend_rows(start_datetime, end_datetime)
+        )
+        brand_names: Dict[int, str] = dict(
+            Brand.objects.filter(pk__in=brand_totals).values_list('id', 'name')
+        )
+        
         # Get spend summary by brand
-        brand_summary = self._get_brand_summary(start_datetime, end_datetime)
+        brand_summary = self._get_brand_summary(brand_totals, campaign_counts, brand_names)
         
         # Get top performing campaigns
-        top_campaigns = self._get_top_campaigns(start_datetime, end_datetime)
+        top_campaigns = self._get_top_campaigns(top_rows, brand_names)
         
         return {
             'period': {'start': start_date, 'end': end_date},
@@ -95,59 +108,113 @@ class Command(BaseCommand):
             'generated_at': timezone.now()
         }
     
-    def _get_brand_summary(
+    def _get_spend_rows(
         self,
         start_datetime: datetime,
         end_datetime: datetime
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream total spend per brand and campaign from a single aggregate query."""
+        # Group on the foreign key columns so the scan needs no joins
+        return SpendRecord.objects.filter(
+            timestamp__range=(start_datetime, end_datetime)
+        ).values('brand_id', 'campaign_id').annotate(
+            total_spend=Sum('amount')
+        ).order_by().iterator(chunk_size=2000)
+    
+    def _summarize_spend(
+        self,
+        spend_rows: Iterable[Dict[str, Any]],
+        limit: int = 5
+    ) -> Tuple[Dict[int, Decimal], Dict[int, int], List[Dict[str, Any]]]:
+        """Fold spend rows into brand totals, campaign counts and the top campaigns."""
+        totals: Dict[int, Decimal] = defaultdict(Decimal)
+        campaign_counts: Dict[int, int] = defaultdict(int)
+        # Min-heap of the largest campaign rows; the negated sequence number
+        # keeps earlier rows ahead on ties and stops dicts being compared
+        top: List[Tuple[Decimal, int, Dict[str, Any]]] = []
+        
+        for seq, row in enumerate(spend_rows):
+            brand_id = row['brand_id']
+            totals[brand_id] += row['total_spend']
+            if row['campaign_id'] is None:
+                continue
+            
+            # Rows are grouped by (brand, campaign), so each campaign appears once
+            campaign_counts[brand_id] += 1
+            entry = (row['total_spend'], -seq, row)
+            if len(top) < limit:
+                heapq.heappush(top, entry)
+            else:
+                heapq.heappushpop(top, entry)
+        
+        return totals, campaign_counts, [row for _, _, row in sorted(top, reverse=True)]
+    
+    def _get_brand_summary(
+        self,
+        brand_totals: Dict[int, Decimal],
+        campaign_counts: Dict[int, int],
+        brand_names: Dict[int, str]
     ) -> List[Dict[str, Any]]:
         """Get spend summary by brand."""
-        spend_by_brand = SpendRecord.objects.filter(
-            timestamp__range=(start_datetime, end_datetime),
-            brand__isnull=False
-        ).values('brand__name').annotate(
-            total_spend=Sum('amount'),
-            campaign_count=Count('campaign', distinct=True)
-        ).order_by('-total_spend')
-        
-        return list(spend_by_brand)
+        summary = [
+            {
+                'brand__name': brand_names[brand_id],
+                'total_spend': total,
+                'campaign_count': campaign_counts.get(brand_id, 0),
+            }
+            for brand_id, total in brand_totals.items()
+        ]
+        summary.sort(key=itemgetter('total_spend'), reverse=True)
+        return summary
     
     def _get_top_campaigns(
         self,
-        start_datetime: datetime,
-        end_datetime: datetime,
-        limit: int = 5
+        top_rows: List[Dict[str, Any]],
+        brand_names: Dict[int, str]
     ) -> List[Dict[str, Any]]:
         """Get top performing campaigns by spend."""
-        return list(SpendRecord.objects.filter(
-            timestamp__range=(start_datetime, end_datetime),
-            campaign__isnull=False
-        ).values('campaign__name', 'brand__name').annotate(
-            total_spend=Sum('amount')
-        ).order_by('-total_spend')[:limit])
+        campaign_names: Dict[int, str] = dict(
+            Campaign.objects.filter(
+                pk__in=[row['campaign_id'] for row in top_rows]
+            ).values_list('id', 'name')
+        )
+        return [
+            {
+                'brand__name': brand_names[row['brand_id']],
+                'campaign__name': campaign_names[row['campaign_id']],
+                'total_spend': row['total_spend'],
+            }
+            for row in top_rows
+        ]
     
     def _print_report(self, report_data: Dict[str, Any]) -> None:
         """Print the report to console."""
+        # Build the whole report and write it in one go
+        lines: List[str] = []
+        
         # Header
-        self.stdout.write(self.style.SUCCESS(
+        lines.append(self.style.SUCCESS(
             f"=== Budget Report ===\n"
             f"Period: {report_data['period']['start']} to {report_data['period']['end']}\n"
-            f"Generated: {report_data['generated_at']}\n"
+            f"Generated: {report_data['generated_at']}"
         ))
         
         # Brand Summary
-        self.stdout.write(self.style.SUCCESS("Brand Summary:"))
+        lines.append(self.style.SUCCESS("Brand Summary:"))
         for brand in report_data['brand_summary']:
-            self.stdout.write(
+            lines.append(
                 f"- {brand['brand__name']}: "
                 f"${brand['total_spend']:.2f} across {brand['campaign_count']} campaigns"
             )
         
         # Top Campaigns
-        self.stdout.write("\n" + self.style.SUCCESS("Top Performing Campaigns:"))
+        lines.append("\n" + self.style.SUCCESS("Top Performing Campaigns:"))
         for i, campaign in enumerate(report_data['top_campaigns'], 1):
-            self.stdout.write(
+            lines.append(
                 f"{i}. {campaign['brand__name']} - {campaign['campaign__name']}: "
                 f"${campaign['total_spend']:.2f}"
             )
         
-        self.stdout.write("\n" + "=" * 40)
\ No newline at end of file
+        lines.append("\n" + "=" * 40)
+        
+        self.stdout.write("\n".join(lines))
\ No newline at end of file
@@ -19,22 +19,30 @@ class Command(BaseCommand):
         """Execute the command."""
         self.stdout.write('Starting daily budget reset...')
         
+        # Read the clock once so every row shares the same reset date
+        now = timezone.now()
+        today = now.date()
+        
         try:
             with transaction.atomic():
-                # Reset brand daily budgets
-                updated_brands = Brand.objects.update(
+                # Reset brand daily budgets, skipping rows already reset today
+                updated_brands = Brand.objects.exclude(
+                    current_daily_spend=0, last_daily_reset=today
+                ).update(
                     current_daily_spend=Decimal('0.00'),
-                    last_daily_reset=timezone.now().date()
+                    last_daily_reset=today
                 )
                 
-                # Reset campaign daily budgets
-                updated_campaigns = Campaign.objects.update(
+                # Reset campaign daily budgets, skipping rows already reset today
+                updated_campaigns = Campaign.objects.exclude(
+                    current_daily_spend=0, last_daily_reset=today
+                ).update(
                     current_daily_spend=Decimal('0.00'),
-                    last_daily_reset=timezone.now().date()
+                    last_daily_reset=today
                 )
                 
                 result = {
-                    'timestamp': timezone.now().isoformat(),
+                    'timestamp': now.isoformat(),
                     'brands_updated': updated_brands,
                     'campaigns_updated': updated_campaigns,
                 }
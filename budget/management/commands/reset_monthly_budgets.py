@@ -19,16 +19,22 @@ class Command(BaseCommand):
         """Execute the command."""
         self.stdout.write('Starting monthly budget reset...')
         
+        # Read the clock once so every row shares the same reset date
+        now = timezone.now()
+        today = now.date()
+        
         try:
             with transaction.atomic():
-                # Reset brand monthly budgets
-                updated_brands = Brand.objects.update(
+                # Reset brand monthly budgets, skipping rows already reset today
+                updated_brands = Brand.objects.exclude(
+                    current_monthly_spend=0, last_monthly_reset=today
+                ).update(
                     current_monthly_spend=Decimal('0.00'),
-                    last_monthly_reset=timezone.now().date()
+                    last_monthly_reset=today
                 )
                 
                 result = {
-                    'timestamp': timezone.now().isoformat(),
+                    'timestamp': now.isoformat(),
                     'brands_updated': updated_brands,
                 }
                 
@@ -13,6 +13,7 @@ from django.db import transaction
 
 from budget.models import Brand, Campaign, DaypartingSchedule
 from budget.models.campaign import CampaignStatus
+from budget.recompute import mark_campaign_dirty
 
 
 class Command(BaseCommand):
@@ -58,10 +59,7 @@ class Command(BaseCommand):
                 brands = self._create_brands(num_brands)
                 
                 # Create campaigns for each brand
-                all_campaigns = []
-                for brand in brands:
-                    campaigns = self._create_campaigns(brand, campaigns_per_brand)
-                    all_campaigns.extend(campaigns)
+                all_campaigns = self._create_campaigns(brands, campaigns_per_brand)
                 
                 # Create dayparting schedules for some campaigns
                 self._create_dayparting_schedules(all_campaigns)
@@ -111,78 +109,85 @@ class Command(BaseCommand):
         # Shuffle the brand names to get a random selection
         random.shuffle(brand_names)
         
+        today = timezone.now().date()
         brands = []
         for i in range(min(count, len(brand_names))):
-            daily_budget = Decimal(str(round(random.uniform(100, 1000), 2)))
+            daily_budget = Decimal(random.randint(10000, 100000)).scaleb(-2)  # $100-$1000 in cents
             monthly_budget = daily_budget * 30  # Rough monthly estimate
             
-            brand = Brand.objects.create(
+            brands.append(Brand(
                 name=brand_names[i],
                 daily_budget=daily_budget,
                 monthly_budget=monthly_budget,
                 current_daily_spend=Decimal('0.00'),
                 current_monthly_spend=Decimal('0.00'),
-                is_active=random.choice([True, True, True, False])  # 75% chance of being active
-            )
-            
-            self.stdout.write(f"  - Created brand: {brand.name} (${daily_budget:.2f} daily budget)")
-            brands.append(brand)
+                is_active=random.choice([True, True, True, False]),  # 75% chance of being active
+                last_daily_reset=today,
+                last_monthly_reset=today,
+            ))
+        
+        # Insert all brands in one batch; bulk_create skips save() and signals,
+        # which have nothing to do for freshly zeroed brands with no campaigns
+        brands = Brand.objects.bulk_create(brands, batch_size=500)
+        
+        for brand in brands:
+            self.stdout.write(f"  - Created brand: {brand.name} (${brand.daily_budget:.2f} daily budget)")
         
         return brands
     
-    def _create_campaigns(self, brand: Brand, count: int) -> List[Campaign]:
-        """Create sample campaigns for a brand."""
-        self.stdout.write(f'Creating {count} campaigns for {brand.name}...')
-        
+    def _create_campaigns(self, brands: List[Brand], count: int) -> List[Campaign]:
+        """Create sample campaigns for each brand."""
         campaign_types = [
             'Search', 'Display', 'Video', 'Social', 'Native',
             'Retargeting', 'Prospecting', 'Awareness', 'Consideration', 'Conversion'
         ]
         
+        today = timezone.now().date()
         campaigns = []
-        for i in range(count):
-            # Generate a campaign name based on brand and type
-            campaign_type = random.choice(campaign_types)
-            campaign_name = f"{brand.name.split()[0]} {campaign_type} Campaign {i+1}"
-            
-            # Set a daily budget (10-30% of brand's daily budget)
-            brand_daily_budget = float(brand.daily_budget)
-            min_budget = max(10.0, brand_daily_budget * 0.1)  # At least $10 or 10% of brand budget
-            max_budget = brand_daily_budget * 0.3
-            daily_budget = Decimal(str(round(random.uniform(min_budget, max_budget), 2)))
-            
-            campaign = Campaign.objects.create(
-                name=campaign_name,
-                brand=brand,
-                daily_budget=daily_budget,
-                current_daily_spend=Decimal('0.00'),
-                status=random.choice([
+        for brand in brands:
+            for i in range(count):
+                # Generate a campaign name based on brand and type
+                campaign_type = random.choice(campaign_types)
+                campaign_name = f"{brand.name.split()[0]} {campaign_type} Campaign {i+1}"
+                
+                # Set a daily budget (10-30% of brand's daily budget)
+                brand_daily_cents = int(brand.daily_budget * 100)
+                min_cents = max(1000, brand_daily_cents // 10)  # At least $10 or 10% of brand budget
+                max_cents = brand_daily_cents * 3 // 10
+                daily_budget = Decimal(random.randint(min_cents, max_cents)).scaleb(-2)
+                
+                status = random.choice([
                     CampaignStatus.ACTIVE,
                     CampaignStatus.PAUSED,
                     CampaignStatus.ACTIVE,
                     CampaignStatus.ACTIVE,  # Higher chance of being active
                     CampaignStatus.COMPLETED,
-                ]),
-                is_active=False,  # Will be set based on status and budget
-                last_daily_reset=timezone.now().date()
-            )
-            
-            # Update is_active based on status
-            if campaign.status == CampaignStatus.ACTIVE:
-                campaign.is_active = True
-                campaign.save(update_fields=['is_active'])
-            
-            status_display = {
-                CampaignStatus.ACTIVE: "Active",
-                CampaignStatus.PAUSED: "Paused",
-                CampaignStatus.COMPLETED: "Completed"
-            }.get(campaign.status, campaign.status)
+                ])
+                
+                campaigns.append(Campaign(
+                    name=campaign_name,
+                    brand=brand,
+                    daily_budget=daily_budget,
+                    current_daily_spend=Decimal('0.00'),
+                    status=status,
+                    # Matches what Campaign.save() would decide for a new, unspent campaign
+                    is_active=status == CampaignStatus.ACTIVE and brand.is_active,
+                    last_daily_reset=today,
+                ))
+        
+        self.stdout.write(f'Creating {len(campaigns)} campaigns for {len(brands)} brands...')
+        campaigns = Campaign.objects.bulk_create(campaigns, batch_size=500)
+        
+        status_display = {
+            CampaignStatus.ACTIVE: "Active",
+            CampaignStatus.PAUSED: "Paused",
+            CampaignStatus.COMPLETED: "Completed"
+        }
+        for campaign in campaigns:
             self.stdout.write(
-                f"  - Created campaign: {campaign.name} (${daily_budget:.2f} daily budget) | "
-                f"Status: {status_display}"
+                f"  - Created campaign: {campaign.name} (${campaign.daily_budget:.2f} daily budget) | "
+                f"Status: {status_display.get(campaign.status, campaign.status)}"
             )
-            
-            campaigns.append(campaign)
         
         return campaigns
     
@@ -206,6 +211,7 @@ class Command(BaseCommand):
             (18, 0, 23, 0),  # Evening hours
         ]
         
+        schedules = []
         for campaign in campaigns_with_schedules:
             # Determine how many days to schedule (1-7)
             num_days = random.randint(1, 7)
@@ -216,7 +222,7 @@ class Command(BaseCommand):
             
             # Create a schedule for each selected day
             for day in days:
-                DaypartingSchedule.objects.create(
+                schedules.append(DaypartingSchedule(
                     campaign=campaign,
                     day_of_week=day,
                     start_time=time(hour=start_hour, minute=start_minute),
@@ -224,10 +230,19 @@ class Command(BaseCommand):
                     timezone='UTC',
                     is_active=random.choice([True, True, False]),  # 2/3 chance of being active
                     priority=random.randint(1, 10)
-                )
+                ))
             
             self.stdout.write(
                 f"  - Added {len(days)} day schedule(s) to {campaign.name} | "
                 f"{time(hour=start_hour, minute=start_minute).strftime('%H:%M')} - "
                 f"{time(hour=end_hour, minute=end_minute).strftime('%H:%M')} UTC"
-            )
\ No newline at end of file
+            )
+        
+        # The time slots are valid and days are unique per campaign, so the
+        # full_clean() done by DaypartingSchedule.save() can be skipped here
+        DaypartingSchedule.objects.bulk_create(schedules, batch_size=1000)
+        
+        # bulk_create() skips the post_save signal, so queue the campaigns for
+        # the re-check it would have run, once each rather than once per schedule
+        for campaign in campaigns_with_schedules:
+            mark_campaign_dirty(campaign.pk)
@@ -1,8 +1,14 @@
 """
 Management command to simulate spending for testing purposes.
 """
+import csv
+import io
+import itertools
+import json
 import random
+import sys
 import uuid
+from collections import defaultdict
 from typing import Any, Dict, List, Optional, Tuple
 from decimal import Decimal
 from datetime import timedelta
@@ -10,11 +16,16 @@ from argparse import ArgumentParser
 
 from django.core.management.base import BaseCommand
 from django.utils import timezone
-from django.db import transaction
+from django.db import connection, transaction
+from django.db.models import Q
+from django.db.models.functions import Now
 
 from budget.models import Brand, SpendRecord
 from budget.models.campaign import Campaign, CampaignStatus
 
+# Above this many records, PostgreSQL databases load them with COPY instead of INSERT
+COPY_THRESHOLD = 5000
+
 
 class Command(BaseCommand):
     """Command to simulate spending for testing purposes."""
@@ -56,6 +67,12 @@ class Command(BaseCommand):
             default=0,
             help='Backdate transactions by this many days (default: 0)'
         )
+        parser.add_argument(
+            '--yes', '--noinput', '--no-input',
+            action='store_true',
+            dest='yes',
+            help='Proceed without asking for confirmation'
+        )
     
     def handle(self, *args: Any, **options: Any) -> None:
         """Execute the command."""
@@ -65,33 +82,35 @@ class Command(BaseCommand):
         num_transactions = options['transactions']
         randomize = options['randomize']
         backdate_days = options['backdate']
+        assume_yes = options['yes']
         
         self.stdout.write('Starting spend simulation...\n')
         
         try:
             # Get the base queryset
-            campaigns = Campaign.objects.select_related('brand').filter(
+            queryset = Campaign.objects.select_related('brand').filter(
                 is_active=True,
                 status=CampaignStatus.ACTIVE
-            )
+            ).order_by('brand__name', 'name')
             
             # Apply filters
             if brand_filter:
-                campaigns = campaigns.filter(brand__name__icontains=brand_filter)
+                queryset = queryset.filter(brand__name__icontains=brand_filter)
             
             if campaign_filter:
-                campaigns = campaigns.filter(name__icontains=campaign_filter)
+                queryset = queryset.filter(name__icontains=campaign_filter)
             
-            if not campaigns.exists():
+            # Fetch once; the grouping and the random picks below reuse this list
+            campaigns: List[Campaign] = list(queryset)
+            if not campaigns:
                 self.stdout.write(self.style.ERROR('No matching active campaigns found.'))
                 return
             
             # Group campaigns by brand for display
-            campaigns_by_brand: Dict[str, List[Campaign]] = {}
-            for campaign in campaigns:
-                if campaign.brand.name not in campaigns_by_brand:
-                    campaigns_by_brand[campaign.brand.name] = []
-                campaigns_by_brand[campaign.brand.name].append(campaign)
+            campaigns_by_brand: Dict[str, List[Campaign]] = {
+                brand_name: list(group)
+                for brand_name, group in itertools.groupby(campaigns, key=lambda c: c.brand.name)
+            }
             
             # Display the campaigns that will be used
             self.stdout.write(self.style.SUCCESS('Found the following campaigns:'))
@@ -105,66 +124,92 @@ class Command(BaseCommand):
                     )
             
             # Confirm before proceeding
-            if not self._confirm_proceed():
+            if not assume_yes and not self._confirm_proceed():
                 self.stdout.write(self.style.WARNING('Simulation cancelled.'))
                 return
             
-            # Simulate the transactions
-            results = []
+            # Simulate the transactions in memory, accumulating spend per campaign and brand
+            results: List[Dict[str, Any]] = []
+            records: List[SpendRecord] = []
+            campaign_deltas: Dict[int, Decimal] = defaultdict(Decimal)
+            brand_deltas: Dict[int, Decimal] = defaultdict(Decimal)
+            last_transaction: Dict[int, Dict[str, Any]] = {}
+            
+            # Draw the campaign for every transaction up front in one call
+            picks = random.choices(campaigns, k=num_transactions)
+            
+            # Random amounts are drawn as whole cents between $0.10 and --amount
+            min_cents, max_cents = sorted((10, int(amount * 100)))
             
+            for i, campaign in enumerate(picks):
+                # Determine the spend amount
+                if randomize:
+                    spend_amount = Decimal(random.randint(min_cents, max_cents)).scaleb(-2)
+                else:
+                    spend_amount = amount
+                
+                # Create a timestamp (optionally backdated)
+                timestamp = timezone.now() - timedelta(days=backdate_days)
+                
+                records.append(SpendRecord(
+                    brand=campaign.brand,
+                    campaign=campaign,
+                    amount=spend_amount,
+                    reference_id=f'sim-{uuid.uuid4().hex[:8]}',
+                    timestamp=timestamp,
+                    metadata={
+                        'simulation': True,
+                        'transaction_num': i + 1,
+                        'total_transactions': num_transactions,
+                    }
+                ))
+                campaign_deltas[campaign.pk] += spend_amount
+                brand_deltas[campaign.brand_id] += spend_amount
+                
+                spent = campaign.current_daily_spend + campaign_deltas[campaign.pk]
+                result = {
+                    'transaction': i + 1,
+                    'campaign_id': campaign.pk,
+                    'campaign': campaign.name,
+                    'brand': campaign.brand.name,
+                    'amount': spend_amount,
+                    'timestamp': timestamp,
+                    'status_changed': False,
+                    'remaining_budget': max(Decimal('0.00'), campaign.daily_budget - spent),
+                }
+                results.append(result)
+                last_transaction[campaign.pk] = result
+            
+            # Write all records and the aggregated spend in a handful of statements
             with transaction.atomic():
-                for i in range(num_transactions):
-                    # Select a random campaign
-                    campaign = random.choice(campaigns)
-                    
-                    # Determine the spend amount
-                    if randomize:
-                        spend_amount = Decimal(str(round(random.uniform(0.1, float(amount)), 2)))
-                    else:
-                        spend_amount = amount
-                    
-                    # Create a timestamp (optionally backdated)
-                    timestamp = timezone.now() - timedelta(days=backdate_days)
-                    
-                    # Create the spend record
-                    spend_record = SpendRecord.objects.create(
-                        brand=campaign.brand,
-                        campaign=campaign,
-                        amount=spend_amount,
-                        reference_id=f'sim-{uuid.uuid4().hex[:8]}',
-                        timestamp=timestamp,
-                        metadata={
-                            'simulation': True,
-                            'transaction_num': i + 1,
-                            'total_transactions': num_transactions,
-                        }
-                    )
-                    
-                    # Update the campaign's current spend
-                    campaign.current_daily_spend += spend_amount
-                    campaign.save(update_fields=['current_daily_spend'])
-                    
-                    # Update the brand's current spend
-                    campaign.brand.current_daily_spend += spend_amount
-                    campaign.brand.current_monthly_spend += spend_amount
-                    campaign.brand.save(
-                        update_fields=['current_daily_spend', 'current_monthly_spend']
-                    )
-                    
-                    # Check if campaign is now over budget
-                    was_active = campaign.is_active
-                    campaign.update_status_based_on_budget()
-                    
-                    results.append({
-                        'transaction': i + 1,
-                        'campaign': campaign.name,
-                        'brand': campaign.brand.name,
-                        'amount': spend_amount,
-                        'timestamp': timestamp,
-                        'campaign_status': 'active' if campaign.is_active else 'paused',
-                        'status_changed': was_active != campaign.is_active,
-                        'remaining_budget': campaign.get_remaining_daily_budget(),
-                    })
+                if connection.vendor == 'postgresql' and len(records) > COPY_THRESHOLD:
+                    self._copy_spend_records(records)
+                else:
+                    SpendRecord.objects.bulk_create(records, batch_size=500)
+                SpendRecord.forget_daily_spend(records)
+                
+                # One UPDATE per table, picking each row's delta with a CASE on its id
+                Campaign.record_spends(campaign_deltas)
+                Brand.record_spends(brand_deltas)
+                
+                # Re-evaluate campaigns that spent, plus active campaigns of brands that
+                # spent. Only active campaigns can change (they can only be paused), so
+                # decide in SQL which ones to pause and pause them with one UPDATE
+                paused_ids = set(Campaign.objects.needs_status_refresh().filter(
+                    Q(pk__in=list(campaign_deltas)) | Q(brand_id__in=list(brand_deltas))
+                ).values_list('pk', flat=True))
+                if paused_ids:
+                    Campaign.objects.filter(pk__in=paused_ids).update(is_active=False, updated_at=Now())
+                
+                statuses: Dict[int, bool] = dict(
+                    Campaign.objects.filter(pk__in=list(campaign_deltas)).values_list('pk', 'is_active')
+                )
+                for campaign_id, result in last_transaction.items():
+                    result['status_changed'] = campaign_id in paused_ids
+            
+            for result in results:
+                is_active = statuses.get(result['campaign_id'], False)
+                result['campaign_status'] = 'active' if is_active else 'paused'
             
             # Display results
             self.stdout.write('\n' + self.style.SUCCESS('=== Simulation Results ==='))
@@ -200,5 +245,41 @@ class Command(BaseCommand):
     def _confirm_proceed(self) -> bool:
         """Ask for user confirmation before proceeding."""
         self.stdout.write('\n' + self.style.WARNING('This will create spend records and update budgets.'))
+        
+        # Nobody can answer the prompt when run from a script or scheduler
+        if not sys.stdin.isatty():
+            return True
+        
         response = input('Do you want to continue? [y/N] ').strip().lower()
-        return response == 'y'
\ No newline at end of file
+        return response == 'y'
+    
+    def _copy_spend_records(self, records: List[SpendRecord]) -> None:
+        """Load spend records with PostgreSQL COPY, bypassing per-row INSERTs."""
+        now = timezone.now()
+        columns = ['brand_id', 'campaign_id', 'amount', 'reference_id', 'timestamp', 'metadata', 'created_at']
+        
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        for record in records:
+            writer.writerow([
+                record.brand_id,
+                '' if record.campaign_id is None else record.campaign_id,
+                record.amount,
+                record.reference_id,
+                record.timestamp.isoformat(),
+                json.dumps(record.metadata),
+                now.isoformat(),
+            ])
+        buf.seek(0)
+        
+        sql = (
+            f'COPY {connection.ops.quote_name(SpendRecord._meta.db_table)} '
+            f'({", ".join(columns)}) FROM STDIN WITH (FORMAT csv)'
+        )
+        with connection.cursor() as cursor:
+            raw_cursor = cursor.cursor
+            if hasattr(raw_cursor, 'copy_expert'):  # psycopg2
+                raw_cursor.copy_expert(sql, buf)
+            else:  # psycopg 3
+                with raw_cursor.copy(sql) as copy:
+                    copy.write(buf.getvalue())
@@ -5,13 +5,18 @@ from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 from argparse import ArgumentParser
 
+from django.conf import settings
+from django.core.cache import cache
 from django.core.management.base import BaseCommand
+from django.db import connection
 from django.utils import timezone
-from django.db.models import Count, Sum, Q, F
+from django.db.models import Count, Sum, Q, F, Exists, OuterRef
 
 from budget.models import Brand, SpendRecord, DaypartingSchedule
 from budget.models.campaign import Campaign, CampaignStatus
 
+SNAPSHOT_CACHE_KEY = 'system_status:snapshot'
+
 
 class Command(BaseCommand):
     """Command to check system health and status."""
@@ -36,41 +41,37 @@ class Command(BaseCommand):
         self.stdout.write('')
         
         try:
-            # Get basic counts
-            brand_count = Brand.objects.count()
-            campaign_count = Campaign.objects.count()
-            spend_record_count = SpendRecord.objects.count()
-            schedule_count = DaypartingSchedule.objects.count()
-            
-            # Get active counts
-            active_brands = Brand.objects.filter(is_active=True).count()
-            active_campaigns = Campaign.objects.filter(
-                is_active=True,
-                status=CampaignStatus.ACTIVE
-            ).count()
-            
-            # Get recent spend records
-            last_hour = now - timedelta(hours=1)
-            recent_spend = SpendRecord.objects.filter(
-                timestamp__gte=last_hour
-            ).aggregate(
-                total_spend=Sum('amount'),
-                record_count=Count('id')
-            )
+            # Reuse a recent snapshot of the counts unless detailed output was asked for
+            ttl = settings.SYSTEM_STATUS_CACHE_TTL
+            snapshot: Optional[Dict[str, Any]] = None
+            if not verbose and ttl > 0:
+                try:
+                    snapshot = cache.get_or_set(
+                        SNAPSHOT_CACHE_KEY,
+                        lambda: self._collect_snapshot(now),
+                        timeout=ttl,
+                    )
+                except Exception as e:
+                    # The cache only saves work; report from the database without it
+                    self.stderr.write(self.style.WARNING(f'Snapshot cache unavailable: {str(e)}'))
+            if snapshot is None:
+                snapshot = self._collect_snapshot(now)
+            brand_stats = snapshot['brands']
+            campaign_stats = snapshot['campaigns']
+            spend_stats = snapshot['spend']
+            schedule_count = snapshot['schedules']
             
-            # Get campaigns over budget
-            over_budget = Campaign.objects.filter(
-                current_daily_spend__gte=F('daily_budget'),
-                is_active=True
-            ).count()
-            
-            # Get campaigns with no dayparting schedules
-            campaigns_without_schedules = Campaign.objects.annotate(
-                schedule_count=Count('dayparting_schedules')
-            ).filter(
-                schedule_count=0,
-                is_active=True
-            ).count()
+            brand_count = brand_stats['total']
+            active_brands = brand_stats['active']
+            campaign_count = campaign_stats['total']
+            active_campaigns = campaign_stats['active']
+            spend_record_count = spend_stats['total']
+            recent_spend = {
+                'total_spend': spend_stats['recent_spend'],
+                'record_count': spend_stats['recent_count'],
+            }
+            over_budget = campaign_stats['over_budget']
+            campaigns_without_schedules = campaign_stats['without_schedules']
             
             # Display summary
             self.stdout.write(self.style.SUCCESS('=== Summary ==='))
@@ -103,10 +104,7 @@ class Command(BaseCommand):
                 ))
             
             # Check for brands over monthly budget
-            brands_over_monthly = Brand.objects.filter(
-                current_monthly_spend__gte=F('monthly_budget'),
-                is_active=True
-            ).count()
+            brands_over_monthly = brand_stats['over_monthly']
             
             if brands_over_monthly > 0:
                 issues.append((
@@ -115,9 +113,7 @@ class Command(BaseCommand):
                 ))
             
             # Check for outdated resets
-            outdated_brands = Brand.objects.filter(
-                last_daily_reset__lt=now.date() - timedelta(days=1)
-            ).count()
+            outdated_brands = brand_stats['outdated']
             
             if outdated_brands > 0:
                 issues.append((
@@ -147,19 +143,62 @@ class Command(BaseCommand):
             )
             raise
     
+    def _collect_snapshot(self, now: datetime) -> Dict[str, Any]:
+        """Collect the system counts with one aggregate query per table."""
+        last_hour = now - timedelta(hours=1)
+        reset_cutoff = now.date() - timedelta(days=1)
+        
+        brand_stats = Brand.objects.aggregate(
+            total=Count('id'),
+            active=Count('id', filter=Q(is_active=True)),
+            over_monthly=Count(
+                'id', filter=Q(is_active=True, current_monthly_spend__gte=F('monthly_budget'))
+            ),
+            outdated=Count('id', filter=Q(last_daily_reset__lt=reset_cutoff)),
+        )
+        
+        campaign_stats = Campaign.objects.annotate(
+            has_schedule=Exists(DaypartingSchedule.objects.filter(campaign=OuterRef('pk')))
+        ).aggregate(
+            total=Count('id'),
+            active=Count('id', filter=Q(is_active=True, status=CampaignStatus.ACTIVE)),
+            over_budget=Count(
+                'id', filter=Q(is_active=True, current_daily_spend__gte=F('daily_budget'))
+            ),
+            without_schedules=Count('id', filter=Q(is_active=True, has_schedule=False)),
+        )
+        
+        spend_stats = SpendRecord.objects.aggregate(
+            total=Count('id'),
+            recent_count=Count('id', filter=Q(timestamp__gte=last_hour)),
+            recent_spend=Sum('amount', filter=Q(timestamp__gte=last_hour)),
+        )
+        
+        schedule_count = DaypartingSchedule.objects.count()
+        
+        return {
+            'brands': brand_stats,
+            'campaigns': campaign_stats,
+            'spend': spend_stats,
+            'schedules': schedule_count,
+        }
+    
     def _show_detailed_information(self, now: datetime) -> None:
         """Show detailed system information."""
         self.stdout.write('\n' + self.style.SUCCESS('=== Detailed Information ==='))
         
         # Show top spending brands
-        top_brands = Brand.objects.order_by('-current_daily_spend')[:5]
+        top_brands = Brand.objects.only(
+            'name', 'current_daily_spend', 'daily_budget'
+        ).order_by('-current_daily_spend')[:5]
         
         self.stdout.write('\n' + self.style.SUCCESS('Top Spending Brands (Today):'))
         for brand in top_brands:
+            # Display precision only, so use float rather than Decimal division
             daily_usage = (
-                (brand.current_daily_spend / brand.daily_budget * 100)
+                float(brand.current_daily_spend) / float(brand.daily_budget) * 100.0
                 if brand.daily_budget > 0
-                else 0
+                else 0.0
             )
             self.stdout.write(
                 f"- {brand.name}: ${brand.current_daily_spend:.2f} / "
@@ -167,16 +206,16 @@ class Command(BaseCommand):
             )
         
         # Show campaigns with highest spend
-        top_campaigns = Campaign.objects.select_related('brand').order_by(
-            '-current_daily_spend'
-        )[:5]
+        top_campaigns = Campaign.objects.select_related('brand').only(
+            'name', 'current_daily_spend', 'daily_budget', 'brand__name'
+        ).order_by('-current_daily_spend')[:5]
         
         self.stdout.write('\n' + self.style.SUCCESS('Top Spending Campaigns (Today):'))
         for campaign in top_campaigns:
             usage = (
-                (campaign.current_daily_spend / campaign.daily_budget * 100)
+                float(campaign.current_daily_spend) / float(campaign.daily_budget) * 100.0
                 if campaign.daily_budget > 0
-                else 0
+                else 0.0
             )
             self.stdout.write(
                 f"- {campaign.brand.name} - {campaign.name}: "
@@ -187,6 +226,8 @@ class Command(BaseCommand):
         # Show recent spend activity
         recent_spends = SpendRecord.objects.select_related(
             'brand', 'campaign'
+        ).only(
+            'timestamp', 'amount', 'brand__name', 'campaign__name'
         ).order_by('-timestamp')[:5]
         
         self.stdout.write('\n' + self.style.SUCCESS('Recent Spend Activity:'))
@@ -209,8 +250,10 @@ class Command(BaseCommand):
         # Check database health
         self.stdout.write('\n' + self.style.SUCCESS('Database Health:'))
         try:
-            # Simple query to check database responsiveness
-            Brand.objects.first()
+            # Trivial round-trip to check database responsiveness
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT 1')
+                cursor.fetchone()
             self.stdout.write("- Connection: ✓ OK")
         except Exception as e:
             self.stdout.write(self.style.ERROR(f"- Connection: ✗ Error: {str(e)}"))
\ No newline at end of file
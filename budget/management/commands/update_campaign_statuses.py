@@ -8,6 +8,7 @@ from django.utils import timezone
 from django.db import transaction
 
 from budget.models import Campaign
+from budget.models.campaign import CampaignQuerySet
 
 
 class Command(BaseCommand):
@@ -38,40 +39,50 @@ class Command(BaseCommand):
         
         try:
             # Get the queryset based on provided campaign IDs
-            queryset = Campaign.objects.all()
+            queryset: CampaignQuerySet = Campaign.objects.get_queryset()
             if campaign_ids:
                 queryset = queryset.filter(pk__in=campaign_ids)
             
             updated_campaigns: List[Dict[str, Any]] = []
             
+            now = timezone.now()
+            
             with transaction.atomic():
-                for campaign in queryset.select_related('brand'):  # type: Campaign
-                    old_status = campaign.is_active
+                # should_be_active() is False for every inactive campaign, so the
+                # only possible change is pausing active ones; find them in SQL
+                # and pause them all with a single UPDATE
+                paused_ids = set(
+                    queryset.needs_status_refresh(now).values_list('pk', flat=True)
+                )
+                if paused_ids:
+                    Campaign.objects.filter(pk__in=paused_ids).update(
+                        is_active=False,
+                        updated_at=now
+                    )
+                
+                # Only read back the campaigns that will be reported, streamed in
+                # chunks so --force over a large table keeps memory bounded
+                report_queryset = queryset if force else queryset.filter(pk__in=paused_ids)
+                for campaign in report_queryset.select_related('brand').iterator(chunk_size=2000):  # type: Campaign
+                    status_changed = campaign.pk in paused_ids
+                    new_status = campaign.is_active
                     
-                    # Update status based on budget and schedule
-                    status_changed = campaign.update_status_based_on_budget()
+                    # Get the current status string
+                    if status_changed:
+                        status_change = f"True -> {new_status}"
+                    else:
+                        status_str = 'active' if new_status else 'paused'
+                        status_change = f"{status_str} (no change)"
                     
-                    # If status changed or force is True, add to results
-                    if status_changed or force:
-                        new_status = campaign.is_active
-                        
-                        # Get the current status string
-                        if status_changed:
-                            status_str = 'activated' if new_status else 'paused'
-                            status_change = f"{old_status} -> {new_status}"
-                        else:
-                            status_str = 'active' if new_status else 'paused'
-                            status_change = f"{status_str} (no change)"
-                        
-                        updated_campaigns.append({
-                            'id': campaign.pk,
-                            'name': campaign.name,
-                            'brand': campaign.brand.name,
-                            'status_change': status_change,
-                            'daily_budget': str(campaign.daily_budget),
-                            'current_spend': str(campaign.current_daily_spend),
-                            'remaining_budget': str(campaign.get_remaining_daily_budget()),
-                        })
+                    updated_campaigns.append({
+                        'id': campaign.pk,
+                        'name': campaign.name,
+                        'brand': campaign.brand.name,
+                        'status_change': status_change,
+                        'daily_budget': str(campaign.daily_budget),
+                        'current_spend': str(campaign.current_daily_spend),
+                        'remaining_budget': str(campaign.get_remaining_daily_budget()),
+                    })
             
             if updated_campaigns:
                 self.stdout.write(self.style.SUCCESS('Updated the following campaigns:'))
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.5 on 2026-10-15 19:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('budget', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='campaign',
+            index=models.Index(condition=models.Q(('current_daily_spend__gte', models.F('daily_budget'))), fields=['id'], name='campaign_over_budget_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.5 on 2026-10-15 19:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('budget', '0002_campaign_over_budget_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='spendrecord',
+            index=models.Index(fields=['timestamp', 'brand', 'campaign', 'amount'], name='spendrec_ts_brand_camp_amt'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.5 on 2026-10-15 20:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('budget', '0003_spendrecord_report_covering_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='brand',
+            index=models.Index(fields=['is_active', 'last_daily_reset'], name='budget_bran_is_acti_ff1f4e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='brand',
+            index=models.Index(fields=['is_active', 'current_monthly_spend'], name='budget_bran_is_acti_e123da_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='campaign',
+            index=models.Index(fields=['is_active', 'status'], name='budget_camp_is_acti_338c02_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='campaign',
+            index=models.Index(fields=['is_active', 'current_daily_spend'], name='budget_camp_is_acti_fadee9_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.5 on 2026-10-15 20:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('budget', '0004_brand_campaign_status_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='daypartingschedule',
+            index=models.Index(fields=['campaign', 'day_of_week', 'is_active', 'start_time', 'end_time'], name='schedule_overlap_idx'),
+        ),
+    ]
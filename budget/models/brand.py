@@ -1,14 +1,15 @@
 """Brand model for the budget management system."""
 from decimal import Decimal
-from typing import Optional, TYPE_CHECKING
+from typing import Dict, Optional, TYPE_CHECKING
 from django.db import models
-from django.db.models import CharField, DecimalField, DateField, BooleanField, DateTimeField
+from django.db.models import CharField, DecimalField, DateField, BooleanField, DateTimeField, F, Case, When, Value
+from django.db.models.functions import Least, Now
 from django.core.validators import MinValueValidator
 from django.utils import timezone
 
 if TYPE_CHECKING:
     from django.db.models.manager import Manager
-    from .campaign import Campaign
+    from .campaign import Campaign, CampaignManager
     from .spend import SpendRecord
 
 
@@ -72,12 +73,17 @@ class Brand(models.Model):
     updated_at: DateTimeField = models.DateTimeField(auto_now=True)
     
     # Type hints for related managers
-    campaigns: 'Manager[Campaign]'
+    campaigns: 'CampaignManager'
     spend_records: 'Manager[SpendRecord]'
     
     class Meta:
         """Meta options for the Brand model."""
         ordering = ['name']
+        indexes = [
+            # Support the system_status health filters
+            models.Index(fields=['is_active', 'last_daily_reset']),
+            models.Index(fields=['is_active', 'current_monthly_spend']),
+        ]
         verbose_name = 'Brand'
         verbose_name_plural = 'Brands'
     
@@ -110,11 +116,47 @@ class Brand(models.Model):
         """
         if amount < 0:
             raise ValueError("Spend amount cannot be negative.")
+        
+        Brand.record_spends({self.pk: amount})
+        self.refresh_from_db(fields=['current_daily_spend', 'current_monthly_spend', 'updated_at'])
+        
+        # update() skips the post_save signal, so pause campaigns that can no longer run here
+        self.campaigns.needs_status_refresh().update(is_active=False, updated_at=Now())
+    
+    @classmethod
+    def record_spends(cls, brand_amounts: Dict[int, Decimal]) -> int:
+        """
+        Record spend against several brands with a single UPDATE.
+        
+        The amounts are added in SQL, so concurrent spends cannot overwrite each
+        other, and are capped at the budgets as the pre_save signal does for
+        regular saves. Campaign statuses are left for the caller to re-evaluate.
+        
+        Args:
+            brand_amounts: The amount to add to each brand's spend, keyed by brand ID.
+            
+        Returns:
+            int: The number of brands updated.
             
-        self.current_daily_spend += amount
-        self.current_monthly_spend += amount
+        Raises:
+            ValueError: If any amount is negative.
+        """
+        if any(amount < 0 for amount in brand_amounts.values()):
+            raise ValueError("Spend amount cannot be negative.")
+        
+        if not brand_amounts:
+            return 0
         
-        self.save(update_fields=['current_daily_spend', 'current_monthly_spend'])
+        amount = Case(
+            *[When(pk=pk, then=Value(value)) for pk, value in brand_amounts.items()],
+            default=Value(Decimal('0.00')),
+            output_field=models.DecimalField(max_digits=12, decimal_places=2),
+        )
+        return cls.objects.filter(pk__in=list(brand_amounts)).update(
+            current_daily_spend=Least(F('current_daily_spend') + amount, F('daily_budget')),
+            current_monthly_spend=Least(F('current_monthly_spend') + amount, F('monthly_budget')),
+            updated_at=Now(),
+        )
     
     def has_daily_budget_available(self) -> bool:
         """Check if the brand has daily budget available."""
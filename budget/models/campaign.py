@@ -1,9 +1,11 @@
 """Campaign model for the budget management system."""
 from decimal import Decimal
-from typing import Optional, TYPE_CHECKING, List, Dict, Any, Tuple
+from functools import lru_cache
+from typing import ClassVar, Optional, TYPE_CHECKING, List, Dict, Any, Tuple
 from datetime import datetime, date
 from django.db import models
-from django.db.models import CharField, ForeignKey, DecimalField, DateField, BooleanField, DateTimeField
+from django.db.models import CharField, ForeignKey, DecimalField, DateField, BooleanField, DateTimeField, F
+from django.db.models.functions import Least, Now
 from django.core.validators import MinValueValidator
 from django.utils import timezone
 
@@ -14,6 +16,35 @@ if TYPE_CHECKING:
     from .schedule import DaypartingSchedule
 
 
+@lru_cache(maxsize=4096)
+def _dayparting_allows(campaign_pk: int, minute: datetime) -> bool:
+    """
+    Check whether a campaign's dayparting schedules let it run at the given minute.
+    
+    Campaigns without schedules run all day, and each schedule is checked in its
+    own timezone, as in DaypartingSchedule.open_now_q(). Results are memoized per
+    minute so the repeated should_be_active() calls made while saving a campaign
+    share one lookup.
+    
+    The memo is per process: the DaypartingSchedule signals clear it in the
+    process that edits a schedule, while other workers keep their cached answer
+    until the minute rolls over.
+    """
+    from .schedule import DaypartingSchedule
+    
+    # Count all schedules and the ones open right now in a single query
+    counts = DaypartingSchedule.objects.filter(campaign_id=campaign_pk).aggregate(
+        total=models.Count('id'),
+        open_now=models.Count(
+            'id',
+            filter=models.Q(is_active=True) & DaypartingSchedule.open_now_q(minute)
+        ),
+    )
+    total: int = counts['total']
+    open_now: int = counts['open_now']
+    return total == 0 or open_now > 0
+
+
 class CampaignStatus(models.TextChoices):
     """Status choices for a campaign."""
     ACTIVE = 'active', 'Active'
@@ -22,6 +53,44 @@ class CampaignStatus(models.TextChoices):
     ARCHIVED = 'archived', 'Archived'
 
 
+# The fields _compute_is_active() reads, plus the campaign and brand names that
+# status sweeps log; pass to .only() on querysets using select_related('brand')
+STATUS_CHECK_FIELDS: Tuple[str, ...] = (
+    'id', 'name', 'status', 'is_active', 'current_daily_spend', 'daily_budget',
+    'brand__id', 'brand__name', 'brand__is_active',
+    'brand__current_daily_spend', 'brand__daily_budget',
+)
+
+
+class CampaignQuerySet(models.QuerySet['Campaign']):
+    """QuerySet with status-sweep helpers for campaigns."""
+    
+    def needs_status_refresh(self, now: Optional[datetime] = None) -> 'CampaignQuerySet':
+        """
+        Filter to campaigns whose is_active flag is stale and must be cleared.
+        
+        should_be_active() is False for every inactive campaign, so the only
+        possible change is pausing an active one; the database prunes all the
+        campaigns that would be no-ops.
+        
+        Args:
+            now: The time to check dayparting schedules against. Defaults to now.
+        """
+        return self.filter(is_active=True).filter(Campaign.should_be_inactive_q(now))
+
+
+class CampaignManager(models.Manager['Campaign']):
+    """Default Campaign manager, exposing the CampaignQuerySet helpers."""
+    
+    def get_queryset(self) -> CampaignQuerySet:
+        """Return a CampaignQuerySet for this manager."""
+        return CampaignQuerySet(self.model, using=self._db)
+    
+    def needs_status_refresh(self, now: Optional[datetime] = None) -> CampaignQuerySet:
+        """See CampaignQuerySet.needs_status_refresh()."""
+        return self.get_queryset().needs_status_refresh(now)
+
+
 class Campaign(models.Model):
     """
     Represents an advertising campaign for a brand.
@@ -74,6 +143,11 @@ class Campaign(models.Model):
     created_at: DateTimeField = models.DateTimeField(auto_now_add=True)
     updated_at: DateTimeField = models.DateTimeField(auto_now=True)
     
+    objects: ClassVar[CampaignManager] = CampaignManager()
+    
+    # Type hints for foreign key columns
+    brand_id: int
+    
     # Type hints for related managers
     spend_records: 'Manager[SpendRecord]'
     dayparting_schedules: 'Manager[DaypartingSchedule]'
@@ -84,6 +158,16 @@ class Campaign(models.Model):
         unique_together = ['brand', 'name']
         verbose_name = 'Campaign'
         verbose_name_plural = 'Campaigns'
+        indexes = [
+            # Support the system_status and status update filters
+            models.Index(fields=['is_active', 'status']),
+            models.Index(fields=['is_active', 'current_daily_spend']),
+            models.Index(
+                fields=['id'],
+                name='campaign_over_budget_idx',
+                condition=models.Q(current_daily_spend__gte=models.F('daily_budget')),
+            ),
+        ]
     
     def __str__(self) -> str:
         """Return string representation of the campaign."""
@@ -99,17 +183,25 @@ class Campaign(models.Model):
         - COMPLETED: Always inactive
         - PAUSED: Always inactive
         - ACTIVE: Active only if should_be_active() is True
+        
+        is_active is settled before the write, so a save never needs a second
+        UPDATE to correct it.
         """
-        if self.status in [CampaignStatus.ARCHIVED, CampaignStatus.COMPLETED, CampaignStatus.PAUSED]:
-            self.is_active = False
-        elif self.status == CampaignStatus.ACTIVE:
-            if not self.should_be_active() and self.is_active:
-                self.is_active = False
+        was_active = self.is_active
+        self.is_active = self._compute_is_active()
         
-        super().save(*args, **kwargs)
+        # Make sure a partial save still persists a status change
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and self.is_active != was_active and 'is_active' not in update_fields:
+            kwargs['update_fields'] = [*update_fields, 'is_active']
         
-        if kwargs.get('update_fields') is None and self.pk:
-            self.update_status_based_on_budget()
+        super().save(*args, **kwargs)
+    
+    def _compute_is_active(self, now: Optional[datetime] = None) -> bool:
+        """Return the is_active value the save() rules call for, without writing it."""
+        if self.status != CampaignStatus.ACTIVE:
+            return False
+        return self.should_be_active(now)
     
     def reset_daily_spend(self) -> None:
         """Reset the daily spend counter and update the last reset date."""
@@ -132,11 +224,52 @@ class Campaign(models.Model):
             
         if amount < 0:
             raise ValueError("Spend amount cannot be negative.")
-            
-        self.current_daily_spend += amount
-        self.save(update_fields=['current_daily_spend'])
         
+        # Add in SQL, guarded on the row still being active, so concurrent spends
+        # cannot overwrite each other; capped at the budget like the pre_save signal
+        updated = Campaign.objects.filter(pk=self.pk, is_active=True).update(
+            current_daily_spend=Least(F('current_daily_spend') + amount, F('daily_budget')),
+            updated_at=Now()
+        )
+        if not updated:
+            raise ValueError("Cannot record spend for inactive campaign.")
+        
+        # Also pauses this brand's campaigns, this one included, that ran out of budget
         self.brand.record_spend(amount)
+        self.refresh_from_db(fields=['current_daily_spend', 'is_active', 'updated_at'])
+    
+    @classmethod
+    def record_spends(cls, campaign_amounts: Dict[int, Decimal]) -> int:
+        """
+        Record spend against several campaigns with a single UPDATE.
+        
+        The amounts are added in SQL and capped at the daily budget, as in
+        record_spend(). Brand spend and campaign statuses are left to the caller.
+        
+        Args:
+            campaign_amounts: The amount to add to each campaign's spend, keyed by campaign ID.
+            
+        Returns:
+            int: The number of campaigns updated.
+            
+        Raises:
+            ValueError: If any amount is negative.
+        """
+        if any(amount < 0 for amount in campaign_amounts.values()):
+            raise ValueError("Spend amount cannot be negative.")
+        
+        if not campaign_amounts:
+            return 0
+        
+        amount = models.Case(
+            *[models.When(pk=pk, then=models.Value(value)) for pk, value in campaign_amounts.items()],
+            default=models.Value(Decimal('0.00')),
+            output_field=models.DecimalField(max_digits=12, decimal_places=2),
+        )
+        return cls.objects.filter(pk__in=list(campaign_amounts)).update(
+            current_daily_spend=Least(F('current_daily_spend') + amount, F('daily_budget')),
+            updated_at=Now()
+        )
     
     def has_daily_budget_available(self) -> bool:
         """Check if the campaign has daily budget available."""
@@ -151,35 +284,76 @@ class Campaign(models.Model):
         remaining = daily_budget - current_daily_spend
         return max(Decimal('0.00'), remaining)
     
-    def should_be_active(self) -> bool:
+    def should_be_active(self, now: Optional[datetime] = None) -> bool:
         """
         Determine if the campaign should be active based on:
         - Campaign status
         - Brand's budget status
         - Dayparting schedule
+        
+        Args:
+            now: The time to check dayparting schedules against. Defaults to now.
         """
-        if not self.is_active or self.status != CampaignStatus.ACTIVE:
+        if not self.is_active or not self._budget_allows():
             return False
             
-        if not self.brand.is_active or not self.brand.has_daily_budget_available():
+        # An unsaved campaign cannot have schedules yet
+        if self.pk is None:
+            return True
+        
+        minute = (now or timezone.now()).replace(second=0, microsecond=0)
+        return _dayparting_allows(self.pk, minute)
+    
+    def _budget_allows(self) -> bool:
+        """Check the status and budget rules of should_be_active(), leaving out dayparting."""
+        if self.status != CampaignStatus.ACTIVE:
             return False
-            
-        if not self.has_daily_budget_available():
+        
+        if not self.brand.is_active or not self.brand.has_daily_budget_available():
             return False
-            
-        if self.dayparting_schedules.exists():
-            now = timezone.now()
-            current_weekday = now.weekday()
-            current_time = now.time()
-            
-            return self.dayparting_schedules.filter(
-                day_of_week=current_weekday,
-                start_time__lte=current_time,
-                end_time__gte=current_time,
-                is_active=True
-            ).exists()
-            
-        return True
+        
+        return self.has_daily_budget_available()
+    
+    @staticmethod
+    def clear_dayparting_cache() -> None:
+        """Forget this process's memoized dayparting checks, e.g. after schedules change."""
+        _dayparting_allows.cache_clear()
+    
+    @staticmethod
+    def should_be_inactive_q(now: Optional[datetime] = None) -> models.Q:
+        """
+        Build a filter matching campaigns for which should_be_active() is False.
+        
+        This mirrors should_be_active() in SQL so the rule can be evaluated for
+        many campaigns in a single query.
+        
+        Args:
+            now: The time to check dayparting schedules against. Defaults to now.
+        """
+        return models.Q(is_active=False) | Campaign.blocked_q(now)
+    
+    @staticmethod
+    def blocked_q(now: Optional[datetime] = None) -> models.Q:
+        """
+        Build a filter matching campaigns should_be_active() rejects regardless of is_active.
+        
+        Excluding it from paused campaigns finds the ones that may run again.
+        
+        Args:
+            now: The time to check dayparting schedules against. Defaults to now.
+        """
+        from .schedule import DaypartingSchedule
+        
+        schedules = DaypartingSchedule.objects.filter(campaign=models.OuterRef('pk'))
+        in_window = schedules.filter(is_active=True).filter(DaypartingSchedule.open_now_q(now))
+        
+        return (
+            ~models.Q(status=CampaignStatus.ACTIVE)
+            | models.Q(brand__is_active=False)
+            | models.Q(brand__current_daily_spend__gte=models.F('brand__daily_budget'))
+            | models.Q(current_daily_spend__gte=models.F('daily_budget'))
+            | (models.Exists(schedules) & ~models.Exists(in_window))
+        )
     
     def update_status_based_on_budget(self) -> bool:
         """
@@ -191,8 +365,14 @@ class Campaign(models.Model):
         should_be_active = self.should_be_active()
         
         if self.is_active != should_be_active:
+            # A plain UPDATE skips save() and post_save, which would only
+            # re-check the status that was just settled
             self.is_active = should_be_active
-            self.save(update_fields=['is_active'])
+            self.updated_at = timezone.now()
+            Campaign.objects.filter(pk=self.pk).update(
+                is_active=self.is_active,
+                updated_at=self.updated_at
+            )
             return True
             
         return False
\ No newline at end of file
@@ -1,6 +1,8 @@
 """DaypartingSchedule model for managing campaign schedules."""
+from functools import lru_cache
 from typing import Optional, TYPE_CHECKING, List, Dict, Any
-from datetime import time
+from datetime import datetime, time
+from zoneinfo import ZoneInfo
 from django.db import models
 from django.db.models import ForeignKey, IntegerField, TimeField, CharField, BooleanField, DateTimeField, Q
 from django.utils import timezone
@@ -12,6 +14,16 @@ if TYPE_CHECKING:
     from .campaign import Campaign
 
 
+@lru_cache(maxsize=512)
+def _zone(name: str) -> ZoneInfo:
+    """Return the ZoneInfo for a timezone name, falling back to UTC if it is unknown."""
+    try:
+        return ZoneInfo(name)
+    except (ValueError, KeyError):
+        # ZoneInfoNotFoundError is a KeyError; malformed names raise ValueError
+        return ZoneInfo('UTC')
+
+
 class DayOfWeek(models.IntegerChoices):
     """Day of week choices for dayparting schedules."""
     MONDAY = 0, 'Monday'
@@ -73,11 +85,21 @@ class DaypartingSchedule(models.Model):
     created_at: DateTimeField = models.DateTimeField(auto_now_add=True)
     updated_at: DateTimeField = models.DateTimeField(auto_now=True)
     
+    # Type hints for foreign key columns
+    campaign_id: int
+    
     class Meta:
         """Meta options for the DaypartingSchedule model."""
         ordering = ['campaign', 'day_of_week', 'start_time']
         verbose_name = 'Dayparting Schedule'
         verbose_name_plural = 'Dayparting Schedules'
+        indexes = [
+            # Support the overlap check in clean()
+            models.Index(
+                fields=['campaign', 'day_of_week', 'is_active', 'start_time', 'end_time'],
+                name='schedule_overlap_idx',
+            ),
+        ]
         constraints = [
             models.UniqueConstraint(
                 fields=['campaign', 'day_of_week', 'start_time', 'end_time'],
@@ -120,24 +142,35 @@ class DaypartingSchedule(models.Model):
                     'end_time': 'End time must be after start time.'
                 })
         
-        # Check for overlapping schedules for the same campaign and day
+        # Let the database find an overlapping schedule for the same campaign and day
         overlapping = DaypartingSchedule.objects.filter(
             campaign=self.campaign,
             day_of_week=self.day_of_week,
-            is_active=True
-        ).exclude(pk=self.pk if self.pk else None)
+            is_active=True,
+            start_time__lt=self.end_time,
+            end_time__gt=self.start_time
+        ).exclude(pk=self.pk if self.pk else None).order_by('start_time').first()
         
-        for schedule in overlapping:
-            if self.start_time < schedule.end_time and self.end_time > schedule.start_time:
-                raise ValidationError(
-                    f"This schedule overlaps with an existing schedule: {schedule}"
-                )
+        if overlapping is not None:
+            raise ValidationError(
+                f"This schedule overlaps with an existing schedule: {overlapping}"
+            )
     
     def save(self, *args: Any, **kwargs: Any) -> None:
-        """Override save to validate the schedule."""
-        self.full_clean()
+        """
+        Override save to validate the schedule.
+        
+        Trusted bulk imports can pass validate=False to skip full_clean().
+        """
+        from .campaign import Campaign
+        
+        if kwargs.pop('validate', True):
+            # Load the campaign together with its brand once for validation
+            if self.campaign_id is not None and not DaypartingSchedule.campaign.is_cached(self):
+                self.campaign = Campaign.objects.select_related('brand').get(pk=self.campaign_id)
+            self.full_clean()
+        
         super().save(*args, **kwargs)
-        self.campaign.update_status_based_on_budget()
     
     def is_active_now(self, tz: Optional[str] = None) -> bool:
         """
@@ -149,22 +182,26 @@ class DaypartingSchedule(models.Model):
         Returns:
             bool: True if the schedule is active now, False otherwise.
         """
-        from datetime import datetime, time
-        
-        tz_to_use = tz or self.timezone
-        now = timezone.now()
+        now = timezone.now().astimezone(_zone(tz or self.timezone))
+        return self.is_active_at(now.weekday(), now.time())
+    
+    def is_active_at(self, weekday: int, time_of_day: time) -> bool:
+        """
+        Check if this schedule is active at a given local weekday and time.
         
-        try:
-            from pytz import timezone as pytz_timezone
-            tz_obj = pytz_timezone(tz_to_use)
-            now = now.astimezone(tz_obj)
-        except Exception:
-            now = timezone.now()
+        Callers checking many schedules can localize "now" once and reuse it.
         
-        if now.weekday() != self.day_of_week:
+        Args:
+            weekday: Day of the week in the schedule's timezone (0=Monday).
+            time_of_day: Time of day in the schedule's timezone.
+            
+        Returns:
+            bool: True if the schedule is active at that moment, False otherwise.
+        """
+        if weekday != self.day_of_week:
             return False
         
-        current_time = now.time()
+        current_time = time_of_day
         start_time: time = self.start_time  # Explicit type assertion
         end_time: time = self.end_time  # Explicit type assertion
         
@@ -187,4 +224,27 @@ class DaypartingSchedule(models.Model):
         return list(cls.objects.filter(
             campaign=campaign,
             is_active=True
-        ).order_by('-priority', 'day_of_week', 'start_time'))
\ No newline at end of file
+        ).order_by('-priority', 'day_of_week', 'start_time'))
+    
+    @classmethod
+    def open_now_q(cls, now: Optional[datetime] = None) -> Q:
+        """
+        Build a filter matching schedules that is_active_now() reports as open.
+        
+        Each schedule is checked in its own timezone, so the filter holds one
+        branch per distinct timezone in use.
+        
+        Args:
+            now: The time to check against. Defaults to now.
+        """
+        now = now or timezone.now()
+        condition = Q(pk__in=[])
+        for tz_name in cls.objects.order_by().values_list('timezone', flat=True).distinct():
+            local_now = now.astimezone(_zone(tz_name))
+            condition |= Q(
+                timezone=tz_name,
+                day_of_week=local_now.weekday(),
+                start_time__lte=local_now.time(),
+                end_time__gte=local_now.time()
+            )
+        return condition
@@ -1,9 +1,14 @@
 """SpendRecord model for tracking advertising spend."""
-from datetime import date, datetime, time
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
 from decimal import Decimal
-from typing import Any, Optional, TYPE_CHECKING
-from django.db import models
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
+from django.conf import settings
+from django.core.cache import cache
+from django.db import models, transaction
 from django.db.models import ForeignKey, DecimalField, DateTimeField, CharField, JSONField
+from django.db.models.functions import Now
 from django.core.validators import MinValueValidator
 from django.utils import timezone
 
@@ -11,6 +16,13 @@ if TYPE_CHECKING:
     from .brand import Brand
     from .campaign import Campaign
 
+logger = logging.getLogger(__name__)
+
+
+def _daily_spend_cache_key(brand_id: int, day: date) -> str:
+    """Return the cache key for a brand's total spend on a given day."""
+    return f'budget:daily_spend:{brand_id}:{day.isoformat()}'
+
 
 class SpendRecord(models.Model):
     """
@@ -60,6 +72,10 @@ class SpendRecord(models.Model):
     
     created_at: DateTimeField = models.DateTimeField(auto_now_add=True)
     
+    # Type hints for foreign key columns
+    brand_id: int
+    campaign_id: Optional[int]
+    
     class Meta:
         """Meta options for the SpendRecord model."""
         ordering = ['-timestamp']
@@ -68,6 +84,11 @@ class SpendRecord(models.Model):
             models.Index(fields=['campaign', 'timestamp']),
             models.Index(fields=['reference_id']),
             models.Index(fields=['timestamp']),
+            # Covers the report aggregates so they can be served by an index-only scan
+            models.Index(
+                fields=['timestamp', 'brand', 'campaign', 'amount'],
+                name='spendrec_ts_brand_camp_amt',
+            ),
         ]
         verbose_name = 'Spend Record'
         verbose_name_plural = 'Spend Records'
@@ -102,31 +123,142 @@ class SpendRecord(models.Model):
                 self.brand.record_spend(self.amount)
         
         super().save(*args, **kwargs)
+        
+        if is_new:
+            SpendRecord.forget_daily_spend([self])
+    
+    @classmethod
+    def bulk_record(cls, records: List['SpendRecord'], batch_size: int = 1000) -> List['SpendRecord']:
+        """
+        Create many spend records and apply their spend in a fixed number of queries.
+        
+        This is the batch counterpart of save(): records are inserted with
+        bulk_create, campaign and brand spend is added with one UPDATE per table,
+        and campaigns that can no longer run are paused with one more.
+        
+        Args:
+            records: The unsaved spend records to create.
+            batch_size: Number of rows per INSERT statement.
+            
+        Returns:
+            List[SpendRecord]: The created spend records.
+            
+        Raises:
+            ValueError: If a campaign does not belong to its record's brand,
+                a campaign is not active, or an amount is negative.
+        """
+        from .brand import Brand
+        from .campaign import Campaign
+        
+        campaign_totals: Dict[int, Decimal] = defaultdict(Decimal)
+        brand_totals: Dict[int, Decimal] = defaultdict(Decimal)
+        for record in records:
+            brand_totals[record.brand_id] += record.amount
+            if record.campaign_id is not None:
+                campaign_totals[record.campaign_id] += record.amount
+        
+        with transaction.atomic():
+            # Validate every referenced campaign in one query, locking the rows
+            campaigns: Dict[int, Tuple[int, bool]] = {
+                pk: (brand_id, is_active)
+                for pk, brand_id, is_active in Campaign.objects.select_for_update().filter(
+                    pk__in=list(campaign_totals)
+                ).values_list('pk', 'brand_id', 'is_active')
+            }
+            for record in records:
+                if record.campaign_id is None:
+                    continue
+                campaign_info = campaigns.get(record.campaign_id)
+                if campaign_info is None or campaign_info[0] != record.brand_id:
+                    raise ValueError("Campaign does not belong to the specified brand.")
+                if not campaign_info[1]:
+                    raise ValueError("Cannot record spend for inactive campaign.")
+            
+            Campaign.record_spends(campaign_totals)
+            Brand.record_spends(brand_totals)
+            created = cls.objects.bulk_create(records, batch_size=batch_size)
+            cls.forget_daily_spend(created)
+            
+            # Pause the affected brands' campaigns that ran out of budget
+            Campaign.objects.needs_status_refresh().filter(
+                brand_id__in=list(brand_totals)
+            ).update(is_active=False, updated_at=Now())
+        
+        return created
     
     @classmethod
-    def get_daily_spend(cls, brand: 'Brand', date: Optional[date] = None) -> Decimal:
+    def get_daily_spend(cls, brand: 'Brand', on_date: Optional[date] = None) -> Decimal:
         """
         Get total spend for a brand on a specific day.
         
         Args:
             brand: The brand to get spend for.
-            date: The date to get spend for. Defaults to today.
+            on_date: The date to get spend for. Defaults to today.
             
         Returns:
             Decimal: Total spend for the day.
         """
-        if date is None:
-            date = timezone.now().date()
+        today = timezone.localdate()
+        if on_date is None:
+            on_date = today
             
-        start = timezone.make_aware(datetime.combine(date, time.min))
-        end = timezone.make_aware(datetime.combine(date, time.max))
+        # Half-open bounds so a record at midnight counts for one day only
+        start = timezone.make_aware(datetime.combine(on_date, time.min))
+        end = timezone.make_aware(datetime.combine(on_date + timedelta(days=1), time.min))
         
-        total = cls.objects.filter(
-            brand=brand,
-            timestamp__range=(start, end)
-        ).aggregate(total=models.Sum('amount'))['total'] or Decimal('0.00')
+        def total_for_day() -> Decimal:
+            day_total: Decimal = cls.objects.filter(
+                brand=brand,
+                timestamp__gte=start,
+                timestamp__lt=end
+            ).aggregate(total=models.Sum('amount'))['total'] or Decimal('0.00')
+            return day_total
+        
+        # Today's total still moves with every spend; past days are cached
+        if on_date >= today:
+            return total_for_day()
+        
+        # The cache only saves work, so an unreachable cache falls back to the query
+        try:
+            total: Optional[Decimal] = cache.get_or_set(
+                _daily_spend_cache_key(brand.pk, on_date),
+                total_for_day,
+                timeout=settings.SPEND_TOTALS_CACHE_TTL
+            )
+        except Exception:
+            logger.warning("Could not read cached daily spend for brand %s", brand.pk, exc_info=True)
+            total = None
+        return total if total is not None else total_for_day()
+    
+    @staticmethod
+    def forget_daily_spend(records: Iterable['SpendRecord']) -> None:
+        """
+        Drop cached daily totals for the brands and days the given records fall on.
+        
+        Writes that bypass save(), such as bulk inserts, must call this too.
+        Only past days are cached, so records dated today need nothing. The
+        delete runs once the transaction commits, and a cache error is logged
+        rather than failing a spend that is already written.
+        
+        Args:
+            records: The spend records that were written.
+        """
+        today = timezone.localdate()
+        keys = set()
+        for record in records:
+            day = timezone.localdate(record.timestamp)
+            if day < today:
+                keys.add(_daily_spend_cache_key(record.brand_id, day))
+        if not keys:
+            return
+        
+        def forget() -> None:
+            try:
+                cache.delete_many(keys)
+            except Exception:
+                logger.warning("Could not drop cached daily spend totals", exc_info=True)
         
-        return total
+        transaction.on_commit(forget)
     
     @classmethod
     def get_monthly_spend(cls, brand: 'Brand', year: Optional[int] = None, 
@@ -155,9 +287,11 @@ class SpendRecord(models.Model):
         else:
             end = timezone.make_aware(datetime(year, month + 1, 1))
             
+        # end is the first instant of the next month, so exclude it
         total = cls.objects.filter(
             brand=brand,
-            timestamp__range=(start, end)
+            timestamp__gte=start,
+            timestamp__lt=end
         ).aggregate(total=models.Sum('amount'))['total'] or Decimal('0.00')
         
         return total
\ No newline at end of file
@@ -0,0 +1,66 @@
+"""Deferred, batched campaign status recomputation for the budget app."""
+from contextvars import ContextVar
+from typing import Optional, Set, Tuple
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.functions import Now
+
+from .models import Campaign
+
+# Campaign IDs and brand IDs whose campaigns need their status re-checked
+_pending: ContextVar[Optional[Tuple[Set[int], Set[int]]]] = ContextVar(
+    'budget_pending_status_recompute', default=None
+)
+
+
+def _pending_sets() -> Tuple[Set[int], Set[int]]:
+    """Return the dirty sets for the current context, creating them if needed."""
+    pending = _pending.get()
+    if pending is None:
+        pending = (set(), set())
+        _pending.set(pending)
+    return pending
+
+
+def mark_campaign_dirty(pk: int) -> None:
+    """
+    Queue a campaign for a status re-check when the current transaction commits.
+    
+    Outside a transaction the check runs immediately.
+    
+    Args:
+        pk: The ID of the campaign to re-check.
+    """
+    _pending_sets()[0].add(pk)
+    # Every mark registers the flush so marks survive a rolled-back savepoint;
+    # the first flush to run handles the whole set and later ones find it empty
+    transaction.on_commit(_flush)
+
+
+def mark_brand_dirty(pk: int) -> None:
+    """
+    Queue all of a brand's campaigns for a status re-check when the current transaction commits.
+    
+    Outside a transaction the check runs immediately.
+    
+    Args:
+        pk: The ID of the brand whose campaigns to re-check.
+    """
+    _pending_sets()[1].add(pk)
+    transaction.on_commit(_flush)
+
+
+def _flush() -> None:
+    """Pause every queued campaign that should no longer run, in a single UPDATE."""
+    pending = _pending.get()
+    _pending.set(None)
+    if pending is None:
+        return
+    
+    campaign_ids, brand_ids = pending
+    if not campaign_ids and not brand_ids:
+        return
+    
+    Campaign.objects.needs_status_refresh().filter(
+        Q(pk__in=campaign_ids) | Q(brand_id__in=brand_ids)
+    ).update(is_active=False, updated_at=Now())
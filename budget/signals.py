@@ -1,11 +1,12 @@
 """Signals for the budget app."""
 from typing import Any, Dict, Optional
-from django.db.models.signals import post_save, pre_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 from django.utils import timezone
 
 from .models import Brand, Campaign, DaypartingSchedule
 from .models.campaign import CampaignStatus
+from .recompute import mark_brand_dirty, mark_campaign_dirty
 
 
 @receiver(pre_save, sender=Brand)
@@ -50,9 +51,22 @@ def update_campaign_status_on_schedule_change(
     **kwargs: Any
 ) -> None:
     """Update campaign status when a dayparting schedule changes."""
-    # Only update if the schedule is active
+    Campaign.clear_dayparting_cache()
+    
+    # Re-check the campaign once the transaction commits, so many schedule
+    # edits in one transaction share a single recompute
     if instance.is_active:
-        instance.campaign.update_status_based_on_budget()
+        mark_campaign_dirty(instance.campaign_id)
+
+
+@receiver(post_delete, sender=DaypartingSchedule)
+def clear_dayparting_cache_on_schedule_delete(
+    sender: Any, 
+    instance: DaypartingSchedule, 
+    **kwargs: Any
+) -> None:
+    """Forget memoized dayparting checks when a schedule is deleted."""
+    Campaign.clear_dayparting_cache()
 
 
 @receiver(post_save, sender=Campaign)
@@ -62,8 +76,14 @@ def update_campaign_status_on_change(
     **kwargs: Any
 ) -> None:
     """Update campaign status when campaign data changes."""
-    # Update status based on budget and schedule
-    instance.update_status_based_on_budget()
+    # Campaign.save() has already settled is_active, and a save of is_active
+    # itself is the status update, so re-checking would only re-enter save()
+    update_fields = kwargs.get('update_fields')
+    if update_fields is None or 'is_active' in update_fields:
+        return
+    
+    # Update status based on budget and schedule once the transaction commits
+    mark_campaign_dirty(instance.pk)
 
 
 @receiver(post_save, sender=Brand)
@@ -73,9 +93,6 @@ def update_brand_campaigns_status(
     **kwargs: Any
 ) -> None:
     """Update status of all campaigns when brand data changes."""
-    from django.db import transaction
-    
-    # Update all active campaigns for this brand
-    for campaign in instance.campaigns.filter(is_active=True):
-        with transaction.atomic():
-            campaign.update_status_based_on_budget()
+    # Re-checked in one batched UPDATE, together with any other campaigns
+    # touched in the same transaction, once it commits
+    mark_brand_dirty(instance.pk)
@@ -1,36 +1,213 @@
 """Celery tasks for budget management."""
+from collections import deque
 from datetime import datetime, date, timedelta
+from functools import wraps
 from typing import List, Optional, Dict, Any, Callable
 from decimal import Decimal
+import hashlib
 import logging
-from celery import shared_task  # type: ignore
+from celery import chord, shared_task  # type: ignore
+from django.conf import settings
+from django.core.cache import cache
 from django.utils import timezone
-from django.db import transaction
-from django.db.models import F, Q
+from django.db import IntegrityError, transaction
+from django.db.models import Exists, F, OuterRef, Q, Value
+from django.db.models.functions import Mod
 
-from .models.campaign import Campaign, CampaignStatus
+from .models.campaign import STATUS_CHECK_FIELDS, Campaign, CampaignStatus
 from .models.brand import Brand
 from .models.spend import SpendRecord
 from .models.schedule import DaypartingSchedule
 
 logger = logging.getLogger(__name__)
 
+# Zero amount used when resetting spend counters
+ZERO = Decimal('0.00')
+
+# Most per-campaign errors a sweep reports in its result; only the latest are kept,
+# all of them are still logged
+MAX_REPORTED_ERRORS = 100
+
+
+def _spend_reference_cache_key(reference_id: str) -> str:
+    """Return the cache key marking a spend reference ID as already recorded."""
+    return f'budget:spend_reference:{reference_id}'
+
+
+def _spend_reference_seen(reference_key: str) -> bool:
+    """Return whether the cache marks a spend reference as recorded, False if it can't tell."""
+    try:
+        return bool(cache.get(reference_key))
+    except Exception:
+        logger.warning("Could not read spend reference marker %s", reference_key, exc_info=True)
+        return False
+
+
+def _remember_spend_reference(reference_key: str, ttl: int) -> None:
+    """Mark a spend reference as recorded, skipping the marker if the cache can't be reached."""
+    try:
+        cache.set(reference_key, True, ttl)
+    except Exception:
+        logger.warning("Could not write spend reference marker %s", reference_key, exc_info=True)
+
+
 # Define a type for shared_task decorator
 SharedTaskDecorator = Callable[
     [Callable[..., Dict[str, Any]]],
     Callable[..., Dict[str, Any]]
 ]
 
+
+def _task_lock_key(name: str, *args: Any, **kwargs: Any) -> str:
+    """Return the cache key of the lock guarding a task call with these arguments."""
+    call = repr((name, args, sorted(kwargs.items()))).encode()
+    return f'budget:task_lock:{hashlib.sha1(call).hexdigest()}'
+
+
+def _acquire_task_lock(lock_key: str) -> bool:
+    """
+    Take a task lock, returning False only if another run already holds it.
+    
+    The lock expires after the task time limit in case a worker dies holding
+    it. It only saves duplicate work, so a cache error lets the run go ahead.
+    """
+    try:
+        return bool(cache.add(lock_key, True, settings.CELERY_TASK_TIME_LIMIT))
+    except Exception:
+        logger.warning("Could not take task lock %s, running anyway", lock_key, exc_info=True)
+        return True
+
+
+def _release_task_lock(lock_key: str) -> None:
+    """Release a task lock, leaving it to expire if the cache can't be reached."""
+    try:
+        cache.delete(lock_key)
+    except Exception:
+        logger.warning("Could not release task lock %s", lock_key, exc_info=True)
+
+
+def _skipped_run(name: str) -> Dict[str, Any]:
+    """Log and return the result of a run skipped because an identical one holds the lock."""
+    logger.info("Skipped %s: an identical run is still in progress", name)
+    return {'timestamp': timezone.now().isoformat(), 'skipped': True}
+
+
+def _single_flight(func: Callable[..., Dict[str, Any]]) -> Callable[..., Dict[str, Any]]:
+    """
+    Skip a task run while an identical call is still running.
+    
+    A cache lock keyed on the task name and arguments guards the run, so a
+    duplicated beat tick or a redelivered message doesn't repeat a full sweep.
+    """
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+        lock_key = _task_lock_key(func.__name__, *args, **kwargs)
+        if not _acquire_task_lock(lock_key):
+            return _skipped_run(func.__name__)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _release_task_lock(lock_key)
+    return wrapper
+
 @shared_task(name="budget.tasks.check_campaign_budgets")  # type: ignore[misc]
-def check_campaign_budgets() -> Dict[str, Any]:
+def check_campaign_budgets(campaign_id: Optional[int] = None) -> Dict[str, Any]:
     """
     Check campaign budgets and update statuses if needed.
     
-    This task runs periodically to ensure campaigns don't exceed their budgets.
+    Spends pause the campaigns they exhaust as they are recorded, so this task
+    runs hourly as a safety net for campaigns that fail their budget checks
+    some other way. With CHECK_CAMPAIGN_BUDGETS_SHARDS above 1, the campaigns
+    are split by ID across that many shard tasks running in parallel, and their
+    statistics are merged by merge_campaign_budget_stats once all of them finish.
+    
+    Like _single_flight, a cache lock skips the run while an identical one is in
+    progress; a sharded run holds it until merge_campaign_budget_stats releases
+    it, or, if a shard fails, until it expires.
+    
+    Args:
+        campaign_id: Optional ID of a single campaign to check instead of all of them.
+        
+    Returns:
+        Dict with statistics about the operation.
+    """
+    lock_key = _task_lock_key('check_campaign_budgets', campaign_id)
+    if not _acquire_task_lock(lock_key):
+        return _skipped_run('check_campaign_budgets')
+    
+    total: int = settings.CHECK_CAMPAIGN_BUDGETS_SHARDS
+    if campaign_id is not None or total <= 1:
+        try:
+            return _check_campaign_budgets(campaign_id=campaign_id)
+        finally:
+            _release_task_lock(lock_key)
+    
+    try:
+        chord(
+            check_campaign_budgets_shard.s(shard, total) for shard in range(total)
+        )(merge_campaign_budget_stats.s(lock_key))
+    except Exception:
+        _release_task_lock(lock_key)
+        raise
+    
+    return {
+        'timestamp': timezone.now().isoformat(),
+        'shards': total,
+    }
+
+
+@shared_task(name="budget.tasks.check_campaign_budgets_shard", ignore_result=False)  # type: ignore[misc]
+def check_campaign_budgets_shard(shard: int, total: int) -> Dict[str, Any]:
+    """
+    Check the budgets of the campaigns whose ID falls in one shard.
     
+    Args:
+        shard: The shard to check, from 0 to total - 1.
+        total: The number of shards.
+        
     Returns:
         Dict with statistics about the operation.
     """
+    return _check_campaign_budgets(shard, total)
+
+
+@shared_task(name="budget.tasks.merge_campaign_budget_stats")  # type: ignore[misc]
+def merge_campaign_budget_stats(results: List[Dict[str, Any]], lock_key: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Combine the statistics of the check_campaign_budgets shards.
+    
+    Args:
+        results: The statistics returned by each shard.
+        lock_key: The lock check_campaign_budgets took for the run, released here.
+        
+    Returns:
+        Dict with statistics about the whole operation.
+    """
+    if lock_key is not None:
+        _release_task_lock(lock_key)
+    
+    stats: Dict[str, Any] = {
+        'timestamp': timezone.now().isoformat(),
+        'shards': len(results),
+        'campaigns_checked': sum(result['campaigns_checked'] for result in results),
+        'campaigns_paused': sum(result['campaigns_paused'] for result in results),
+        'campaigns_reactivated': sum(result['campaigns_reactivated'] for result in results),
+        'errors': [error for result in results for error in result['errors']],
+    }
+    logger.info(
+        "Checked %s campaigns in %s shards: %s paused, %s reactivated",
+        stats['campaigns_checked'], stats['shards'],
+        stats['campaigns_paused'], stats['campaigns_reactivated']
+    )
+    return stats
+
+
+def _check_campaign_budgets(
+    shard: int = 0,
+    total: int = 1,
+    campaign_id: Optional[int] = None
+) -> Dict[str, Any]:
+    """Check the budgets of the campaigns in one shard, or of one campaign; see check_campaign_budgets."""
     stats: Dict[str, Any] = {
         'timestamp': timezone.now().isoformat(),
         'campaigns_checked': 0,
@@ -40,41 +217,26 @@ def check_campaign_budgets() -> Dict[str, Any]:
     }
     
     try:
-        # Get all active campaigns
-        campaigns = Campaign.objects.filter(
-            status=CampaignStatus.ACTIVE
-        ).select_related('brand')
+        campaigns = Campaign.objects.get_queryset().filter(status=CampaignStatus.ACTIVE)
+        if campaign_id is not None:
+            campaigns = campaigns.filter(pk=campaign_id)
+        elif total > 1:
+            campaigns = campaigns.alias(shard=Mod('id', Value(total))).filter(shard=shard)
         
-        for campaign in campaigns:
-            try:
-                with transaction.atomic():
-                    stats['campaigns_checked'] += 1
-                    
-                    # Check if campaign should be active based on budget and schedule
-                    should_be_active: bool = campaign.should_be_active()
-                    
-                    if campaign.is_active and not should_be_active:
-                        # Pause the campaign
-                        campaign.is_active = False
-                        campaign.save(update_fields=['is_active', 'updated_at'])
-                        stats['campaigns_paused'] += 1
-                        logger.info(
-                            f"Paused campaign {campaign.pk} - {campaign.name} "
-                            f"(Brand: {campaign.brand.name})"
-                        )
-                    elif not campaign.is_active and should_be_active:
-                        # Reactivate the campaign
-                        campaign.is_active = True
-                        campaign.save(update_fields=['is_active', 'updated_at'])
-                        stats['campaigns_reactivated'] += 1
-                        logger.info(
-                            f"Reactivated campaign {campaign.pk} - {campaign.name} "
-                            f"(Brand: {campaign.brand.name})"
-                        )
-            except Exception as e:
-                error_msg = f"Error processing campaign {campaign.pk}: {str(e)}"
-                logger.error(error_msg, exc_info=True)
-                stats['errors'].append(error_msg)
+        # Evaluate the status rules in SQL and pause every campaign that fails
+        # them with one UPDATE instead of checking each campaign in Python;
+        # should_be_active() never reactivates a paused campaign, so neither does this
+        now = timezone.now()
+        with transaction.atomic():
+            stats['campaigns_checked'] = campaigns.count()
+            stats['campaigns_paused'] = campaigns.needs_status_refresh(now).update(
+                is_active=False, updated_at=now
+            )
+        
+        logger.info(
+            "Checked %s campaigns: %s paused",
+            stats['campaigns_checked'], stats['campaigns_paused']
+        )
     except Exception as e:
         error_msg = f"Error in check_campaign_budgets task: {str(e)}"
         logger.error(error_msg, exc_info=True)
@@ -83,31 +245,26 @@ def check_campaign_budgets() -> Dict[str, Any]:
     return stats
 
 
-def _reactivate_eligible_campaigns() -> Dict[str, int]:
-    """Reactivate campaigns that were paused due to budget constraints."""
+def _reactivate_eligible_campaigns(now: Optional[datetime] = None) -> Dict[str, int]:
+    """
+    Reactivate paused campaigns that the status rules allow to run again.
+    
+    Campaigns paused by an operator have a paused status, which blocked_q()
+    rejects, so only campaigns paused by their budgets or dayparting return.
+    """
     stats: Dict[str, int] = {
         'campaigns_reactivated': 0,
         'brands_reactivated': 0
     }
     
-    # Reactivate eligible campaigns
-    campaigns = Campaign.objects.filter(
-        status=CampaignStatus.ACTIVE,
-        is_active=False,
-        daily_budget__gt=F('current_daily_spend')
-    ).select_related('brand')
-    
-    for campaign in campaigns:
-        try:
-            # Only reactivate if brand has budget and campaign passes all checks
-            if (campaign.brand.is_active and 
-                campaign.brand.has_daily_budget_available() and
-                campaign.should_be_active()):
-                campaign.is_active = True
-                campaign.save(update_fields=['is_active', 'updated_at'])
-                stats['campaigns_reactivated'] += 1
-        except Exception as e:
-            logger.error(f"Error reactivating campaign {campaign.pk}: {str(e)}", exc_info=True)
+    # Reactivate every paused campaign that passes the should_be_active() rules
+    # (status, brand and campaign budgets, dayparting) with a single UPDATE
+    now = now or timezone.now()
+    stats['campaigns_reactivated'] = Campaign.objects.filter(
+        is_active=False
+    ).exclude(
+        Campaign.blocked_q(now)
+    ).update(is_active=True, updated_at=now)
     
     return stats
 
@@ -131,27 +288,38 @@ def reset_daily_budgets() -> Dict[str, Any]:
     }
     
     try:
-        # Reset brand daily spends
-        updated_brands: int = Brand.objects.update(
-            current_daily_spend=Decimal('0.00'),
-            last_daily_reset=timezone.now().date()
-        )
-        stats['brands_updated'] = updated_brands
+        now = timezone.now()
         
-        # Reset campaign daily spends
-        updated_campaigns: int = Campaign.objects.update(
-            current_daily_spend=Decimal('0.00'),
-            last_daily_reset=timezone.now().date()
-        )
-        stats['campaigns_updated'] = updated_campaigns
+        # Run the resets and the reactivation in one transaction so they share
+        # a single commit and no worker sees spends reset but campaigns still paused
+        with transaction.atomic():
+            # Reset brand daily spends, skipping rows already reset today so a
+            # repeated run rewrites nothing
+            updated_brands: int = Brand.objects.exclude(
+                current_daily_spend=0, last_daily_reset=now.date()
+            ).update(
+                current_daily_spend=ZERO,
+                last_daily_reset=now.date()
+            )
+            
+            # Reset campaign daily spends, skipping rows already reset today
+            updated_campaigns: int = Campaign.objects.exclude(
+                current_daily_spend=0, last_daily_reset=now.date()
+            ).update(
+                current_daily_spend=ZERO,
+                last_daily_reset=now.date()
+            )
+            
+            # Reactivate eligible campaigns
+            reactivation_stats = _reactivate_eligible_campaigns(now)
         
-        # Reactivate eligible campaigns
-        reactivation_stats = _reactivate_eligible_campaigns()
+        stats['brands_updated'] = updated_brands
+        stats['campaigns_updated'] = updated_campaigns
         stats.update(reactivation_stats)
         
         logger.info(
-            f"Reset daily budgets: {updated_brands} brands, {updated_campaigns} campaigns, "
-            f"{reactivation_stats['campaigns_reactivated']} campaigns reactivated"
+            "Reset daily budgets: %s brands, %s campaigns, %s campaigns reactivated",
+            updated_brands, updated_campaigns, reactivation_stats['campaigns_reactivated']
         )
     except Exception as e:
         error_msg = f"Error in reset_daily_budgets task: {str(e)}"
@@ -179,20 +347,26 @@ def reset_monthly_budgets() -> Dict[str, Any]:
     }
     
     try:
-        # Reset brand monthly spends
-        updated_brands: int = Brand.objects.update(
-            current_monthly_spend=Decimal('0.00'),
-            last_monthly_reset=timezone.now().date()
-        )
-        stats['brands_updated'] = updated_brands
+        now = timezone.now()
         
-        # Reactivate eligible campaigns (both daily and monthly budgets were reset)
-        reactivation_stats = _reactivate_eligible_campaigns()
+        with transaction.atomic():
+            # Reset brand monthly spends, skipping rows already reset today
+            updated_brands: int = Brand.objects.exclude(
+                current_monthly_spend=0, last_monthly_reset=now.date()
+            ).update(
+                current_monthly_spend=ZERO,
+                last_monthly_reset=now.date()
+            )
+            
+            # Reactivate eligible campaigns (both daily and monthly budgets were reset)
+            reactivation_stats = _reactivate_eligible_campaigns(now)
+        
+        stats['brands_updated'] = updated_brands
         stats.update(reactivation_stats)
         
         logger.info(
-            f"Reset monthly budgets: {updated_brands} brands, "
-            f"{reactivation_stats['campaigns_reactivated']} campaigns reactivated"
+            "Reset monthly budgets: %s brands, %s campaigns reactivated",
+            updated_brands, reactivation_stats['campaigns_reactivated']
         )
     except Exception as e:
         error_msg = f"Error in reset_monthly_budgets task: {str(e)}"
@@ -203,6 +377,7 @@ def reset_monthly_budgets() -> Dict[str, Any]:
 
 
 @shared_task(name="budget.tasks.update_campaign_statuses")  # type: ignore[misc]
+@_single_flight
 def update_campaign_statuses() -> Dict[str, Any]:
     """
     Update campaign statuses based on dayparting schedules.
@@ -221,37 +396,55 @@ def update_campaign_statuses() -> Dict[str, Any]:
     }
     
     try:
-        # Get all active campaigns with dayparting schedules
+        now = timezone.now()
+        
+        # Get all active campaigns with dayparting schedules, flagging in the
+        # same query whether any of their active schedules is open right now
+        schedules = DaypartingSchedule.objects.filter(campaign=OuterRef('pk'))
+        open_schedules = schedules.filter(is_active=True).filter(DaypartingSchedule.open_now_q(now))
         campaigns = Campaign.objects.filter(
-            status=CampaignStatus.ACTIVE,
-            dayparting_schedules__isnull=False
-        ).distinct()
+            Exists(schedules),
+            status=CampaignStatus.ACTIVE
+        ).annotate(
+            schedule_open=Exists(open_schedules)
+        ).select_related('brand').only(*STATUS_CHECK_FIELDS)
+        
+        changed: List[Campaign] = []
+        errors: deque[str] = deque(maxlen=MAX_REPORTED_ERRORS)
         
-        for campaign in campaigns:
+        for campaign in campaigns.iterator(chunk_size=2000):
             try:
                 stats['campaigns_checked'] += 1
                 
-                # Check if campaign should be active based on dayparting
-                should_be_active: bool = any(
-                    schedule.is_active_now() 
-                    for schedule in campaign.dayparting_schedules.filter(is_active=True)
-                )
+                # Check if campaign should be active based on dayparting, still
+                # subject to the budget rules that save() would have applied
+                schedule_open: bool = campaign.schedule_open  # type: ignore[attr-defined]
+                should_be_active = schedule_open and campaign._budget_allows()
                 
                 # Update status if needed
                 if campaign.is_active != should_be_active:
                     campaign.is_active = should_be_active
-                    campaign.save(update_fields=['is_active', 'updated_at'])
-                    stats['status_changes'] += 1
-                    
-                    action = "activated" if should_be_active else "paused"
-                    logger.info(
-                        f"{action.capitalize()} campaign {campaign.pk} - {campaign.name} "
-                        f"(Brand: {campaign.brand.name}) based on dayparting schedule"
-                    )
+                    campaign.updated_at = now
+                    changed.append(campaign)
             except Exception as e:
-                error_msg = f"Error updating status for campaign {campaign.pk}: {str(e)}"
-                logger.error(error_msg, exc_info=True)
-                stats['errors'].append(error_msg)
+                logger.error("Error updating status for campaign %s", campaign.pk, exc_info=True)
+                errors.append(f"Campaign {campaign.pk}: {e!r}")
+        stats['errors'].extend(errors)
+        
+        # Write every change in bulk rather than saving campaigns one by one
+        with transaction.atomic():
+            Campaign.objects.bulk_update(changed, ['is_active', 'updated_at'], batch_size=10_000)
+        stats['status_changes'] = len(changed)
+        
+        # Skip the whole loop when INFO is filtered out; the brand name comes
+        # from the select_related join, so logging never queries
+        if logger.isEnabledFor(logging.INFO):
+            for campaign in changed:
+                logger.info(
+                    "%s campaign %s - %s (Brand: %s) based on dayparting schedule",
+                    "Activated" if campaign.is_active else "Paused",
+                    campaign.pk, campaign.name, campaign.brand.name
+                )
     except Exception as e:
         error_msg = f"Error in update_campaign_statuses task: {str(e)}"
         logger.error(error_msg, exc_info=True)
@@ -260,7 +453,13 @@ def update_campaign_statuses() -> Dict[str, Any]:
     return stats
 
 
-@shared_task(name="budget.tasks.process_spend_record")  # type: ignore[misc]
+@shared_task(
+    name="budget.tasks.process_spend_record",
+    ignore_result=False,
+    acks_late=False,
+    time_limit=30,
+    soft_time_limit=25,
+)  # type: ignore[misc]
 def process_spend_record(
     brand_id: int, 
     amount: Decimal, 
@@ -287,12 +486,32 @@ def process_spend_record(
         'errors': [],
         'warnings': []
     }
+    duplicate_warning = f"Spend record with reference_id {reference_id} already exists"
+    reference_key = _spend_reference_cache_key(reference_id)
+    # The marker is written by one worker and read by another, so it is only
+    # useful in a cache every worker shares
+    reference_ttl: int = settings.SPEND_REFERENCE_CACHE_TTL if settings.CACHE_IS_SHARED else 0
     
     try:
+        # Answer redelivered spends from the cache before touching the database;
+        # the unique index on reference_id remains the source of truth
+        if reference_ttl and _spend_reference_seen(reference_key):
+            result['warnings'].append(duplicate_warning)
+            return result
+        
         with transaction.atomic():
-            # Get the brand
+            # Check for a redelivery before applying anything; a campaign paused
+            # since the first delivery would otherwise reject it as a new spend
+            if SpendRecord.objects.filter(reference_id=reference_id).exists():
+                result['warnings'].append(duplicate_warning)
+                if reference_ttl:
+                    _remember_spend_reference(reference_key, reference_ttl)
+                return result
+            
+            # Get the brand; no row lock is needed because spend is added with
+            # atomic F() updates
             try:
-                brand = Brand.objects.select_for_update().get(pk=brand_id)
+                brand = Brand.objects.get(pk=brand_id)
             except Brand.DoesNotExist:
                 result['errors'].append(f"Brand with ID {brand_id} does not exist")
                 return result
@@ -301,7 +520,7 @@ def process_spend_record(
             campaign: Optional[Campaign] = None
             if campaign_id is not None:
                 try:
-                    campaign = Campaign.objects.select_for_update().get(
+                    campaign = Campaign.objects.select_related('brand').get(
                         pk=campaign_id, 
                         brand=brand
                     )
@@ -310,21 +529,26 @@ def process_spend_record(
                         f"Campaign with ID {campaign_id} not found or doesn't belong to brand {brand_id}"
                     )
             
-            # Check if the reference_id already exists
-            if SpendRecord.objects.filter(reference_id=reference_id).exists():
-                result['warnings'].append(
-                    f"Spend record with reference_id {reference_id} already exists"
-                )
+            # Create the spend record, letting the unique index on reference_id
+            # reject duplicates that race past the check above; the savepoint
+            # also rolls back the spend that save() applied before the INSERT failed
+            try:
+                with transaction.atomic():
+                    spend_record = SpendRecord.objects.create(
+                        brand=brand,
+                        campaign=campaign,
+                        amount=amount,
+                        reference_id=reference_id,
+                        metadata=metadata or {}
+                    )
+            except IntegrityError:
+                result['warnings'].append(duplicate_warning)
+                if reference_ttl:
+                    _remember_spend_reference(reference_key, reference_ttl)
                 return result
             
-            # Create the spend record
-            spend_record = SpendRecord.objects.create(
-                brand=brand,
-                campaign=campaign,
-                amount=amount,
-                reference_id=reference_id,
-                metadata=metadata or {}
-            )
+            if reference_ttl:
+                transaction.on_commit(lambda: _remember_spend_reference(reference_key, reference_ttl))
             
             result.update({
                 'success': True,
@@ -335,15 +559,114 @@ def process_spend_record(
                 'timestamp': spend_record.timestamp.isoformat()
             })
             
-            logger.info(
-                f"Processed spend record {spend_record.pk} - {amount} USD "
-                f"for brand {brand.name}" + 
-                (f" and campaign {campaign.name}" if campaign else "")
-            )
+            if campaign:
+                logger.info(
+                    "Processed spend record %s - %s USD for brand %s and campaign %s",
+                    spend_record.pk, amount, brand.name, campaign.name
+                )
+            else:
+                logger.info(
+                    "Processed spend record %s - %s USD for brand %s",
+                    spend_record.pk, amount, brand.name
+                )
             
     except Exception as e:
         error_msg = f"Error processing spend record: {str(e)}"
         logger.error(error_msg, exc_info=True)
         result['errors'].append(error_msg)
     
-    return result
\ No newline at end of file
+    return result
+
+@shared_task(name="budget.tasks.process_spend_records_batch", ignore_result=False)  # type: ignore[misc]
+def process_spend_records_batch(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Process many spend records in a single task.
+    
+    This is the batch counterpart of process_spend_record: records are checked
+    with one query per table, inserted with bulk_create, and their spend is
+    applied with one aggregated UPDATE per table.
+    
+    Args:
+        records: Spend records as dicts with brand_id, amount and reference_id
+            keys, and optional campaign_id and metadata keys.
+        
+    Returns:
+        Dict with the result of the operation.
+    """
+    result: Dict[str, Any] = {
+        'success': False,
+        'records_created': 0,
+        'record_ids': [],
+        'errors': [],
+        'warnings': []
+    }
+    
+    try:
+        brand_ids = {record['brand_id'] for record in records}
+        campaign_ids = {record['campaign_id'] for record in records if record.get('campaign_id') is not None}
+        reference_ids = [record['reference_id'] for record in records]
+        
+        # Load everything needed to validate the batch in one query per table
+        existing_brands = set(Brand.objects.filter(pk__in=brand_ids).values_list('pk', flat=True))
+        campaigns: Dict[int, Dict[str, Any]] = {
+            campaign['pk']: campaign
+            for campaign in Campaign.objects.filter(pk__in=campaign_ids).values('pk', 'brand_id', 'is_active')
+        }
+        seen_references = set(
+            SpendRecord.objects.filter(reference_id__in=reference_ids).values_list('reference_id', flat=True)
+        )
+        
+        spend_records: List[SpendRecord] = []
+        for record in records:
+            brand_id = record['brand_id']
+            reference_id = record['reference_id']
+            campaign_id = record.get('campaign_id')
+            
+            if brand_id not in existing_brands:
+                result['errors'].append(f"Brand with ID {brand_id} does not exist")
+                continue
+            
+            if reference_id in seen_references:
+                result['warnings'].append(
+                    f"Spend record with reference_id {reference_id} already exists"
+                )
+                continue
+            
+            if campaign_id is not None:
+                campaign = campaigns.get(campaign_id)
+                if campaign is None or campaign['brand_id'] != brand_id:
+                    result['warnings'].append(
+                        f"Campaign with ID {campaign_id} not found or doesn't belong to brand {brand_id}"
+                    )
+                    campaign_id = None
+                elif not campaign['is_active']:
+                    result['errors'].append(
+                        f"Cannot record spend {reference_id} for inactive campaign {campaign_id}"
+                    )
+                    continue
+            
+            seen_references.add(reference_id)
+            spend_records.append(SpendRecord(
+                brand_id=brand_id,
+                campaign_id=campaign_id,
+                amount=Decimal(str(record['amount'])),
+                reference_id=reference_id,
+                metadata=record.get('metadata') or {}
+            ))
+        
+        created = SpendRecord.bulk_record(spend_records, batch_size=10_000)
+        
+        result.update({
+            'success': True,
+            'records_created': len(created),
+            'record_ids': [spend_record.pk for spend_record in created],
+        })
+        
+        logger.info("Processed %s of %s spend records in a batch", len(created), len(records))
+        
+    except Exception as e:
+        error_msg = f"Error processing spend record batch: {str(e)}"
+        logger.error(error_msg, exc_info=True)
+        result['errors'].append(error_msg)
+    
+    return result
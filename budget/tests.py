@@ -0,0 +1,202 @@
+"""Tests for the budget app's status rules and tasks."""
+from datetime import time
+from typing import Any, Optional, Set
+from decimal import Decimal
+from zoneinfo import ZoneInfo
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+
+from .models import Brand, Campaign, DaypartingSchedule, SpendRecord
+from .models.campaign import CampaignStatus
+from .tasks import (
+    check_campaign_budgets,
+    process_spend_record,
+    reset_daily_budgets,
+    update_campaign_statuses,
+)
+
+ALL_DAY = (time(0, 0), time(23, 59, 59, 999999))
+
+
+class BudgetTestCase(TestCase):
+    """Base test case with helpers to build brands, campaigns and schedules."""
+    
+    def setUp(self) -> None:
+        """Start every test with a fresh brand and an empty cache."""
+        cache.clear()
+        self.brand = self.make_brand('Acme')
+    
+    def make_brand(self, name: str, **kwargs: Any) -> Brand:
+        """Create a brand with generous budgets."""
+        kwargs.setdefault('daily_budget', Decimal('1000.00'))
+        kwargs.setdefault('monthly_budget', Decimal('10000.00'))
+        return Brand.objects.create(name=name, **kwargs)
+    
+    def make_campaign(self, name: str, brand: Optional[Brand] = None, **kwargs: Any) -> Campaign:
+        """Create a campaign with a daily budget of 100."""
+        kwargs.setdefault('daily_budget', Decimal('100.00'))
+        return Campaign.objects.create(name=name, brand=brand or self.brand, **kwargs)
+    
+    def make_schedule(
+        self,
+        campaign: Campaign,
+        open_now: bool,
+        tz: str = 'UTC',
+        **kwargs: Any
+    ) -> DaypartingSchedule:
+        """Create an all-day schedule on today's weekday in tz, or on another day if open_now is False."""
+        weekday = timezone.now().astimezone(ZoneInfo(tz)).weekday()
+        if not open_now:
+            weekday = (weekday + 3) % 7
+        start_time, end_time = ALL_DAY
+        return DaypartingSchedule.objects.create(
+            campaign=campaign,
+            day_of_week=weekday,
+            start_time=start_time,
+            end_time=end_time,
+            timezone=tz,
+            **kwargs
+        )
+    
+    def refreshed(self, campaign: Campaign) -> Campaign:
+        """Reload a campaign from the database."""
+        return Campaign.objects.get(pk=campaign.pk)
+
+
+class SpendTests(BudgetTestCase):
+    """Tests for recording spend through process_spend_record."""
+    
+    def test_over_budget_campaign_is_paused(self) -> None:
+        """A spend that uses up the daily budget pauses the campaign."""
+        campaign = self.make_campaign('Search')
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            result = process_spend_record(self.brand.pk, Decimal('100.00'), 'ref-1', campaign.pk)
+        
+        self.assertTrue(result['success'])
+        campaign = self.refreshed(campaign)
+        self.assertEqual(campaign.current_daily_spend, Decimal('100.00'))
+        self.assertFalse(campaign.is_active)
+    
+    def test_check_campaign_budgets_pauses_over_budget_campaign(self) -> None:
+        """The budget sweep pauses campaigns that ran out of budget some other way."""
+        campaign = self.make_campaign('Search')
+        Campaign.objects.filter(pk=campaign.pk).update(current_daily_spend=Decimal('100.00'))
+        
+        stats = check_campaign_budgets()
+        
+        self.assertEqual(stats['campaigns_paused'], 1)
+        self.assertFalse(self.refreshed(campaign).is_active)
+    
+    def test_duplicate_reference_id_is_skipped(self) -> None:
+        """A redelivered spend is reported as a duplicate and applied only once."""
+        campaign = self.make_campaign('Search')
+        
+        first = process_spend_record(self.brand.pk, Decimal('10.00'), 'ref-1', campaign.pk)
+        second = process_spend_record(self.brand.pk, Decimal('10.00'), 'ref-1', campaign.pk)
+        
+        self.assertTrue(first['success'])
+        self.assertFalse(second['success'])
+        self.assertEqual(second['errors'], [])
+        self.assertIn("Spend record with reference_id ref-1 already exists", second['warnings'])
+        self.assertEqual(SpendRecord.objects.filter(reference_id='ref-1').count(), 1)
+        self.assertEqual(self.refreshed(campaign).current_daily_spend, Decimal('10.00'))
+    
+    def test_duplicate_reference_id_is_skipped_for_paused_campaign(self) -> None:
+        """A redelivery is still a duplicate after the first delivery paused the campaign."""
+        campaign = self.make_campaign('Search')
+        process_spend_record(self.brand.pk, Decimal('10.00'), 'ref-1', campaign.pk)
+        Campaign.objects.filter(pk=campaign.pk).update(is_active=False)
+        
+        result = process_spend_record(self.brand.pk, Decimal('10.00'), 'ref-1', campaign.pk)
+        
+        self.assertEqual(result['errors'], [])
+        self.assertIn("Spend record with reference_id ref-1 already exists", result['warnings'])
+
+
+class StatusSweepTests(BudgetTestCase):
+    """Tests that the status sweeps only reactivate campaigns the rules allow to run."""
+    
+    def run_sweeps(self) -> None:
+        """Run every periodic task that may change campaign statuses."""
+        reset_daily_budgets()
+        check_campaign_budgets()
+        update_campaign_statuses()
+    
+    def test_operator_paused_campaign_stays_paused(self) -> None:
+        """No sweep resumes a campaign an operator paused."""
+        campaign = self.make_campaign('Search', status=CampaignStatus.PAUSED)
+        self.assertFalse(campaign.is_active)
+        
+        self.run_sweeps()
+        
+        campaign = self.refreshed(campaign)
+        self.assertEqual(campaign.status, CampaignStatus.PAUSED)
+        self.assertFalse(campaign.is_active)
+    
+    def test_schedule_paused_campaign_stays_paused(self) -> None:
+        """No sweep resumes a campaign outside its dayparting schedule."""
+        campaign = self.make_campaign('Search')
+        self.make_schedule(campaign, open_now=False)
+        Campaign.objects.filter(pk=campaign.pk).update(is_active=True)
+        
+        update_campaign_statuses()
+        self.assertFalse(self.refreshed(campaign).is_active)
+        
+        self.run_sweeps()
+        
+        self.assertFalse(self.refreshed(campaign).is_active)
+    
+    def test_budget_paused_campaign_is_reactivated_by_reset(self) -> None:
+        """The daily reset resumes campaigns that were only paused by their budget."""
+        campaign = self.make_campaign('Search')
+        Campaign.objects.filter(pk=campaign.pk).update(
+            current_daily_spend=Decimal('100.00'), is_active=False
+        )
+        
+        reset_daily_budgets()
+        
+        campaign = self.refreshed(campaign)
+        self.assertEqual(campaign.current_daily_spend, Decimal('0.00'))
+        self.assertTrue(campaign.is_active)
+
+
+class BlockedQTests(BudgetTestCase):
+    """Tests that Campaign.blocked_q() agrees with the Python status rules."""
+    
+    def test_blocked_q_matches_compute_is_active(self) -> None:
+        """blocked_q() rejects exactly the campaigns _compute_is_active() does."""
+        inactive_brand = self.make_brand('Initech', is_active=False)
+        spent_brand = self.make_brand('Globex')
+        
+        self.make_campaign('Runnable')
+        self.make_campaign('Paused', status=CampaignStatus.PAUSED)
+        self.make_campaign('Completed', status=CampaignStatus.COMPLETED)
+        self.make_campaign('Archived', status=CampaignStatus.ARCHIVED)
+        self.make_campaign('Inactive brand', brand=inactive_brand)
+        self.make_campaign('Spent brand', brand=spent_brand)
+        Brand.objects.filter(pk=spent_brand.pk).update(current_daily_spend=Decimal('1000.00'))
+        over_budget = self.make_campaign('Over budget')
+        Campaign.objects.filter(pk=over_budget.pk).update(current_daily_spend=Decimal('100.00'))
+        self.make_schedule(self.make_campaign('Open schedule'), open_now=True)
+        self.make_schedule(self.make_campaign('Closed schedule'), open_now=False)
+        self.make_schedule(self.make_campaign('Inactive schedule'), open_now=True, is_active=False)
+        self.make_schedule(self.make_campaign('Open in Tokyo'), open_now=True, tz='Asia/Tokyo')
+        self.make_schedule(self.make_campaign('Closed in Tokyo'), open_now=False, tz='Asia/Tokyo')
+        
+        now = timezone.now()
+        Campaign.clear_dayparting_cache()
+        blocked = set(Campaign.objects.filter(Campaign.blocked_q(now)).values_list('name', flat=True))
+        expected: Set[str] = set()
+        for campaign in Campaign.objects.select_related('brand'):
+            # blocked_q() ignores is_active, while should_be_active() is sticky
+            campaign.is_active = True
+            if not campaign._compute_is_active(now):
+                expected.add(campaign.name)
+        
+        self.assertEqual(blocked, expected)
+        self.assertEqual(blocked, {
+            'Paused', 'Completed', 'Archived', 'Inactive brand', 'Spent brand',
+            'Over budget', 'Closed schedule', 'Inactive schedule', 'Closed in Tokyo',
+        })
@@ -1,13 +1,15 @@
 """Celery configuration for the budget manager."""
+import logging
 import os
 from celery import Celery  # type: ignore
 from celery.schedules import crontab  # type: ignore
-from django.conf import settings
-from typing import Any, Dict, Callable
+from typing import Any, Callable
 
 # Set the default Django settings module for the 'celery' program.
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'budget_manager.settings')
 
+logger = logging.getLogger(__name__)
+
 app = Celery('budget_manager')
 
 # Using a string here means the worker doesn't have to serialize
@@ -16,26 +18,15 @@ app = Celery('budget_manager')
 #   should have a `CELERY_` prefix.
 app.config_from_object('django.conf:settings', namespace='CELERY')
 
-# Worker settings and task settings
-app.conf.update(
-    worker_concurrency=settings.CELERY_WORKER_CONCURRENCY,
-    worker_prefetch_multiplier=settings.CELERY_WORKER_PREFETCH_MULTIPLIER,
-    worker_max_tasks_per_child=settings.CELERY_WORKER_MAX_TASKS_PER_CHILD,
-    task_time_limit=settings.CELERY_TASK_TIME_LIMIT,
-    task_soft_time_limit=settings.CELERY_TASK_SOFT_TIME_LIMIT,
-    task_track_started=True,
-    task_send_sent_event=True,
-    timezone='UTC',
-)
-
-# Load task modules from all registered Django app configs.
-app.autodiscover_tasks()
+# Load task modules; budget is the only app that defines tasks, so the other
+# installed apps aren't probed for a tasks module
+app.autodiscover_tasks(['budget'])
 
 # Configure periodic tasks
 app.conf.beat_schedule = {
     'check-campaign-budgets': {
         'task': 'budget.tasks.check_campaign_budgets',
-        'schedule': crontab(minute='*/5'),  # Every 5 minutes
+        'schedule': crontab(minute=0),  # Hourly; spends pause campaigns as they are recorded
     },
     'reset-daily-budgets': {
         'task': 'budget.tasks.reset_daily_budgets',
@@ -54,7 +45,8 @@ app.conf.beat_schedule = {
 # Define a type for the task decorator
 TaskDecorator = Callable[[Callable[[Any], None]], Callable[[Any], None]]
 
-@app.task(bind=True, ignore_result=True)  # type: ignore[misc]
+# Expire debug pings that wait in a backlog rather than replaying them later
+@app.task(bind=True, ignore_result=True, expires=10)  # type: ignore[misc]
 def debug_task(self: Any) -> None:
     """Debug task to verify Celery is working."""
-    print(f'Request: {self.request!r}')
\ No newline at end of file
+    logger.info("Celery debug task received, id=%s", self.request.id)
\ No newline at end of file
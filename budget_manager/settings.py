@@ -1,8 +1,11 @@
 """Django settings for budget_manager project."""
+from __future__ import annotations
+
 from pathlib import Path
 import os
+import secrets
 from dotenv import load_dotenv
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional
 
 # Load environment variables
 load_dotenv()
@@ -41,10 +44,16 @@ try:
 except ImportError:
     pass
 
-# Generate a new secret key if not in production
+# Generate a secret key if not in production, stored in a local file so every
+# development process (runserver, its autoreloader, Celery workers) shares it
 if DEBUG and (SECRET_KEY == 'django-insecure-your-secret-key-here' or len(SECRET_KEY) < 50):
-    from django.core.management.utils import get_random_secret_key
-    SECRET_KEY = get_random_secret_key()
+    _dev_secret_file = BASE_DIR / '.dev_secret'
+    if _dev_secret_file.exists():
+        SECRET_KEY = _dev_secret_file.read_text().strip()
+    else:
+        SECRET_KEY = secrets.token_urlsafe(64)
+        _dev_secret_file.touch(mode=0o600)
+        _dev_secret_file.write_text(SECRET_KEY)
 
 # Application definition
 INSTALLED_APPS: List[str] = [
@@ -54,8 +63,6 @@ INSTALLED_APPS: List[str] = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
-    'django_celery_beat',
-    'django_celery_results',
     'budget.apps.BudgetConfig',
 ]
 
@@ -90,8 +97,26 @@ TEMPLATES: List[Dict[str, Any]] = [
 WSGI_APPLICATION: str = 'budget_manager.wsgi.application'
 
 # Database
+# PostgreSQL when DB_NAME is set, so concurrent workers can commit in parallel;
+# otherwise a local SQLite file for development
 DATABASES: Dict[str, Dict[str, Any]] = {
     'default': {
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': os.getenv('DB_NAME'),
+        'USER': os.getenv('DB_USER', ''),
+        'PASSWORD': os.getenv('DB_PASSWORD', ''),
+        'HOST': os.getenv('DB_HOST', 'localhost'),
+        'PORT': os.getenv('DB_PORT', '5432'),
+        # Keep connections open across requests and tasks instead of reconnecting
+        'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', '600')),
+        'CONN_HEALTH_CHECKS': True,
+        # Set DB_PGBOUNCER=True behind PgBouncer in transaction pooling mode,
+        # which can't keep the server-side cursors iterator() uses open
+        'DISABLE_SERVER_SIDE_CURSORS': os.getenv('DB_PGBOUNCER', 'False') == 'True',
+        'OPTIONS': {
+            'sslmode': os.getenv('DB_SSLMODE', 'prefer'),
+        },
+    } if os.getenv('DB_NAME') else {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
     }
@@ -125,24 +150,108 @@ STATIC_URL: str = 'static/'
 # Default primary key field type
 DEFAULT_AUTO_FIELD: str = 'django.db.models.BigAutoField'
 
+# Redis server used by Celery as its broker and, in its own database, as the cache
+REDIS_URL: str = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+
+# Cache Configuration
+# Set CACHE_URL (e.g. database 1 on the REDIS_URL server) so every process shares
+# the cache: task locks, spend reference markers and cached results then hold
+# across workers and separate management command runs. Without it each process
+# gets its own memory cache and nothing depends on a cache server being up
+CACHE_URL: Optional[str] = os.getenv('CACHE_URL') or None
+CACHES: Dict[str, Dict[str, Any]] = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': CACHE_URL,
+    } if CACHE_URL else {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+# Whether every process sees the same cache; per-process caches skip the
+# cross-worker markers that would only fill each worker's memory
+CACHE_IS_SHARED: bool = CACHE_URL is not None
+
+# Seconds the system_status counts are served from the cache (0 disables it)
+SYSTEM_STATUS_CACHE_TTL: int = int(os.getenv('SYSTEM_STATUS_CACHE_TTL', '30'))
+
+# Seconds a brand's spend total for a past day is served from the cache (0 disables it)
+SPEND_TOTALS_CACHE_TTL: int = int(os.getenv('SPEND_TOTALS_CACHE_TTL', '300'))
+
+# Seconds a recorded spend reference ID is remembered in the cache so redelivered
+# spend tasks skip the database (0 disables it; always off without a shared cache)
+SPEND_REFERENCE_CACHE_TTL: int = int(os.getenv('SPEND_REFERENCE_CACHE_TTL', '86400'))
+
 # Celery Configuration
-CELERY_BROKER_URL: str = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
-CELERY_RESULT_BACKEND: str = 'django-db'
+CELERY_BROKER_URL: str = REDIS_URL
+# Reuse a pool of kept-alive broker connections instead of reconnecting to publish
+CELERY_BROKER_POOL_LIMIT: int = 50
+CELERY_BROKER_CONNECTION_RETRY_ON_STARTUP: bool = True
+CELERY_BROKER_TRANSPORT_OPTIONS: Dict[str, Any] = {
+    'socket_keepalive': True,
+    'health_check_interval': 30,
+    # Must stay above CELERY_TASK_TIME_LIMIT or long tasks get redelivered
+    'visibility_timeout': 3600,
+}
+CELERY_REDIS_SOCKET_CONNECT_TIMEOUT: int = 2
+# Task results are stored in Redis next to the broker; set CELERY_RESULT_BACKEND
+# to django-db to keep them in the database through django_celery_results instead
+CELERY_RESULT_BACKEND: str = os.getenv('CELERY_RESULT_BACKEND', CELERY_BROKER_URL)
+if CELERY_RESULT_BACKEND == 'django-db':
+    INSTALLED_APPS.append('django_celery_results')
+# Seconds stored task results are kept before they expire
+CELERY_RESULT_EXPIRES: int = 3600
+CELERY_RESULT_EXTENDED: bool = False
 CELERY_ACCEPT_CONTENT: List[str] = ['application/json']
 CELERY_TASK_SERIALIZER: str = 'json'
 CELERY_RESULT_SERIALIZER: str = 'json'
 CELERY_TIMEZONE: str = TIME_ZONE
+# Task state and sent events only help when a monitor such as Flower reads
+# them, so they cost extra broker and backend writes unless CELERY_EVENTS=True
+CELERY_TASK_TRACK_STARTED: bool = os.getenv('CELERY_EVENTS', 'False') == 'True'
+CELERY_TASK_SEND_SENT_EVENT: bool = CELERY_TASK_TRACK_STARTED
+# Don't store task results unless a task opts back in; only the chord shards of
+# check_campaign_budgets and the spend tasks return results anyone reads
+CELERY_TASK_IGNORE_RESULT: bool = True
+
+# Number of parallel shard tasks check_campaign_budgets splits campaigns into (1 runs inline)
+CHECK_CAMPAIGN_BUDGETS_SHARDS: int = int(os.getenv('CHECK_CAMPAIGN_BUDGETS_SHARDS', '1'))
 
 # Celery Beat Configuration
-CELERY_BEAT_SCHEDULER: str = 'django_celery_beat.schedulers:DatabaseScheduler'
+# The schedule is the static beat_schedule in budget_manager/celery.py, kept in
+# memory with a local state file; set CELERY_BEAT_SCHEDULER to
+# django_celery_beat.schedulers:DatabaseScheduler to manage it in the database
+CELERY_BEAT_SCHEDULER: str = os.getenv('CELERY_BEAT_SCHEDULER', 'celery.beat:PersistentScheduler')
+if CELERY_BEAT_SCHEDULER.startswith('django_celery_beat.'):
+    INSTALLED_APPS.append('django_celery_beat')
+# Longest the scheduler sleeps between checks for due tasks, in seconds
+CELERY_BEAT_MAX_LOOP_INTERVAL: int = 5
 
 # Worker Configuration
-# Number of worker processes/threads (default: number of CPU cores)
-CELERY_WORKER_CONCURRENCY: int = 4
-# Number of messages to prefetch per worker (default: 4 * concurrency)
-CELERY_WORKER_PREFETCH_MULTIPLIER: int = 2
+# Execution pool: prefork by default; gevent or eventlet (installed separately)
+# run many I/O-bound tasks as green threads in one process
+CELERY_WORKER_POOL: str = os.getenv('CELERY_WORKER_POOL', 'prefork')
+# Number of worker processes/threads (green threads are far cheaper than processes)
+CELERY_WORKER_CONCURRENCY: int = int(os.getenv(
+    'CELERY_WORKER_CONCURRENCY',
+    '200' if CELERY_WORKER_POOL in ('gevent', 'eventlet') else '4'
+))
+# Number of messages to prefetch per worker process; with 1, a long task never
+# holds back queued ones that an idle worker could run
+CELERY_WORKER_PREFETCH_MULTIPLIER: int = 1
+# Acknowledge messages once their task finishes, so unstarted ones stay with the broker
+CELERY_TASK_ACKS_LATE: bool = True
+# The periodic status sweeps get their own queue so the budget resets and spend
+# ingestion can't delay them; workers must consume both queues, e.g. -Q celery,latency
+CELERY_TASK_ROUTES: Dict[str, Dict[str, str]] = {
+    'budget.tasks.check_campaign_budgets': {'queue': 'latency'},
+    'budget.tasks.check_campaign_budgets_shard': {'queue': 'latency'},
+    'budget.tasks.merge_campaign_budget_stats': {'queue': 'latency'},
+    'budget.tasks.update_campaign_statuses': {'queue': 'latency'},
+}
 # Maximum number of tasks a worker can execute before being replaced (prevents memory leaks)
 CELERY_WORKER_MAX_TASKS_PER_CHILD: int = 100
+# Resident memory in KiB after which a worker process is replaced once its current task ends
+CELERY_WORKER_MAX_MEMORY_PER_CHILD: int = 200000
 # Time in seconds after which a task will be killed if it hasn't completed
 CELERY_TASK_TIME_LIMIT: int = 30 * 60  # 30 minutes
 # Time in seconds after which a task will raise a SoftTimeLimitExceeded exception
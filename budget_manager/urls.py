@@ -4,23 +4,15 @@ from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
 
-def _get_api_urls() -> list:
-    """Get API URL patterns."""
-    return [
-        # Add API URL patterns here
-    ]
+API_URLS: list = [
+    # Add API URL patterns here
+]
 
-
-def _get_urlpatterns() -> list:
-    """Get the URL patterns for the project."""
-    return [
-        path('admin/', admin.site.urls),
-        path('api/', include((_get_api_urls(), 'api'), namespace='api')),
-    ]
-
-
-urlpatterns: list = _get_urlpatterns()
+urlpatterns: list = [
+    path('admin/', admin.site.urls),
+    path('api/', include((API_URLS, 'api'), namespace='api')),
+]
 
 # Add static and media URLs in development
-if settings.DEBUG:
+if settings.DEBUG and settings.STATIC_ROOT:
     urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)